@@ -0,0 +1,237 @@
+/*
+ * Dijkstra compilé sur l'adjacence CSR (voir Graph.to_csr)
+ *
+ * Extension optionnelle : si elle n'est pas compilée, graphlabs.algorithms.kernels
+ * l'indique par HAS_CDIJKSTRA = False et le module Dijkstra utilise Numba ou Python.
+ * Les tableaux sont lus par le protocole buffer : pas besoin des en-têtes numpy
+ * à la compilation.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <math.h>
+#include <stdint.h>
+#include <string.h>
+
+/* Ordre de heapq sur les tuples (distance, sommet) : mêmes prédécesseurs en cas d'égalité */
+#define LESS(ka, na, kb, nb) ((ka) < (kb) || ((ka) == (kb) && (na) < (nb)))
+
+/* Tas binaire min rangé dans deux tableaux parallèles, alloués une seule fois */
+typedef struct {
+    double *key;
+    int32_t *node;
+    Py_ssize_t size;
+} Heap;
+
+static void
+heap_push(Heap *heap, double key, int32_t node)
+{
+    Py_ssize_t i = heap->size++;
+    while (i > 0) {
+        Py_ssize_t parent = (i - 1) / 2;
+        if (!LESS(key, node, heap->key[parent], heap->node[parent]))
+            break;
+        heap->key[i] = heap->key[parent];
+        heap->node[i] = heap->node[parent];
+        i = parent;
+    }
+    heap->key[i] = key;
+    heap->node[i] = node;
+}
+
+static void
+heap_pop(Heap *heap, double *key, int32_t *node)
+{
+    *key = heap->key[0];
+    *node = heap->node[0];
+    Py_ssize_t size = --heap->size;
+    if (size == 0)
+        return;
+
+    double last_key = heap->key[size];
+    int32_t last_node = heap->node[size];
+    Py_ssize_t i = 0;
+    for (;;) {
+        Py_ssize_t child = 2 * i + 1;
+        if (child >= size)
+            break;
+        if (child + 1 < size &&
+            LESS(heap->key[child + 1], heap->node[child + 1], heap->key[child], heap->node[child]))
+            child++;
+        if (!LESS(heap->key[child], heap->node[child], last_key, last_node))
+            break;
+        heap->key[i] = heap->key[child];
+        heap->node[i] = heap->node[child];
+        i = child;
+    }
+    heap->key[i] = last_key;
+    heap->node[i] = last_node;
+}
+
+/* Vérifie qu'un buffer est un tableau 1D dont le type correspond à itemsize/codes */
+static int
+check_buffer(const Py_buffer *view, const char *name, Py_ssize_t itemsize, const char *codes)
+{
+    const char *format = view->format ? view->format : "B";
+    /* Le dernier caractère donne le type ; un préfixe d'ordre des octets est ignoré */
+    char code = format[strlen(format) - 1];
+    if (view->ndim != 1 || view->itemsize != itemsize || strchr(codes, code) == NULL) {
+        /* Le format de PyErr_Format doit rester ASCII : accents passés par %s */
+        PyErr_Format(PyExc_TypeError, "%s : tableau 1D attendu de %zd octets par %s (format '%s')",
+                     name, itemsize, "élément", format);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+cdijkstra_dijkstra(PyObject *self, PyObject *args)
+{
+    PyObject *indptr_obj, *indices_obj, *weights_obj, *dist_obj, *prev_obj;
+    Py_ssize_t start;
+    Py_buffer indptr_view = {0}, indices_view = {0}, weights_view = {0};
+    Py_buffer dist_view = {0}, prev_view = {0};
+    Heap heap = {NULL, NULL, 0};
+    uint64_t *done = NULL;
+    PyObject *result = NULL;
+    int bad_index = 0;
+
+    if (!PyArg_ParseTuple(args, "OOOnOO", &indptr_obj, &indices_obj, &weights_obj,
+                          &start, &dist_obj, &prev_obj))
+        return NULL;
+
+    const int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+    if (PyObject_GetBuffer(indptr_obj, &indptr_view, flags) < 0 ||
+        PyObject_GetBuffer(indices_obj, &indices_view, flags) < 0 ||
+        PyObject_GetBuffer(weights_obj, &weights_view, flags) < 0 ||
+        PyObject_GetBuffer(dist_obj, &dist_view, flags | PyBUF_WRITABLE) < 0 ||
+        PyObject_GetBuffer(prev_obj, &prev_view, flags | PyBUF_WRITABLE) < 0)
+        goto finally;
+
+    if (check_buffer(&indptr_view, "indptr", 4, "il") < 0 ||
+        check_buffer(&indices_view, "indices", 4, "il") < 0 ||
+        check_buffer(&weights_view, "weights", weights_view.itemsize == 4 ? 4 : 8,
+                     weights_view.itemsize == 4 ? "f" : "d") < 0 ||
+        check_buffer(&dist_view, "dist", 8, "d") < 0 ||
+        check_buffer(&prev_view, "prev", 4, "il") < 0)
+        goto finally;
+
+    const int32_t *indptr = indptr_view.buf;
+    const int32_t *indices = indices_view.buf;
+    /* Poids float32 (type par défaut de Graph.to_csr) ou float64 */
+    const float *weights_f = weights_view.itemsize == 4 ? weights_view.buf : NULL;
+    const double *weights_d = weights_view.itemsize == 4 ? NULL : weights_view.buf;
+    double *dist = dist_view.buf;
+    int32_t *prev = prev_view.buf;
+    Py_ssize_t n = indptr_view.shape[0] - 1;
+    Py_ssize_t nnz = indices_view.shape[0];
+
+    if (n < 0 || dist_view.shape[0] != n || prev_view.shape[0] != n) {
+        PyErr_SetString(PyExc_ValueError, "dist et prev doivent avoir un élément par ligne CSR");
+        goto finally;
+    }
+    if (start < 0 || start >= n) {
+        PyErr_Format(PyExc_ValueError, "%s %zd hors de [0, %zd)", "sommet de départ", start, n);
+        goto finally;
+    }
+    if (weights_view.shape[0] < nnz || indptr[0] != 0 || indptr[n] > nnz) {
+        PyErr_SetString(PyExc_ValueError, "adjacence CSR incohérente");
+        goto finally;
+    }
+
+    /* Chaque relaxation réussie empile au plus une entrée : nnz + 1 suffisent */
+    heap.key = PyMem_Malloc((nnz + 1) * sizeof(double));
+    heap.node = PyMem_Malloc((nnz + 1) * sizeof(int32_t));
+    done = PyMem_Calloc((n + 63) / 64, sizeof(uint64_t));
+    if (heap.key == NULL || heap.node == NULL || done == NULL) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < n; i++) {
+        dist[i] = INFINITY;
+        prev[i] = -1;
+    }
+    dist[start] = 0.0;
+    heap_push(&heap, 0.0, (int32_t)start);
+
+    while (heap.size > 0) {
+        double curr_dist;
+        int32_t curr;
+        heap_pop(&heap, &curr_dist, &curr);
+        /* Chaque sommet n'est traité qu'une fois (entrées périmées ignorées) */
+        if (done[curr >> 6] & ((uint64_t)1 << (curr & 63)))
+            continue;
+        done[curr >> 6] |= (uint64_t)1 << (curr & 63);
+
+        int32_t lo = indptr[curr], hi = indptr[curr + 1];
+        if (lo < 0 || hi > nnz || lo > hi) {
+            bad_index = 1;
+            break;
+        }
+        for (int32_t k = lo; k < hi; k++) {
+            int32_t neighbor = indices[k];
+            if (neighbor < 0 || neighbor >= n) {
+                bad_index = 1;
+                break;
+            }
+            if (done[neighbor >> 6] & ((uint64_t)1 << (neighbor & 63)))
+                continue;
+            /* Cumul en double quel que soit le type des poids */
+            double distance = curr_dist + (weights_f ? (double)weights_f[k] : weights_d[k]);
+            if (distance < dist[neighbor]) {
+                dist[neighbor] = distance;
+                prev[neighbor] = curr;
+                heap_push(&heap, distance, neighbor);
+            }
+        }
+        if (bad_index)
+            break;
+    }
+    Py_END_ALLOW_THREADS
+
+    if (bad_index) {
+        PyErr_SetString(PyExc_ValueError, "adjacence CSR incohérente");
+        goto finally;
+    }
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+finally:
+    PyMem_Free(heap.key);
+    PyMem_Free(heap.node);
+    PyMem_Free(done);
+    /* PyBuffer_Release ignore les buffers jamais obtenus (obj == NULL) */
+    PyBuffer_Release(&indptr_view);
+    PyBuffer_Release(&indices_view);
+    PyBuffer_Release(&weights_view);
+    PyBuffer_Release(&dist_view);
+    PyBuffer_Release(&prev_view);
+    return result;
+}
+
+static PyMethodDef cdijkstra_methods[] = {
+    {"dijkstra", cdijkstra_dijkstra, METH_VARARGS,
+     "dijkstra(indptr, indices, weights, start, dist, prev)\n"
+     "--\n\n"
+     "Plus courts chemins depuis start (poids positifs).\n\n"
+     "indptr/indices en int32, weights en float32 ou float64 (voir Graph.to_csr).\n"
+     "Remplit dist "
+     "(float64[V], inf si inaccessible) et prev (int32[V], -1 sans prédécesseur)."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef cdijkstra_module = {
+    PyModuleDef_HEAD_INIT,
+    "_cdijkstra",
+    "Dijkstra compilé sur l'adjacence CSR",
+    -1,
+    cdijkstra_methods
+};
+
+PyMODINIT_FUNC
+PyInit__cdijkstra(void)
+{
+    return PyModule_Create(&cdijkstra_module);
+}
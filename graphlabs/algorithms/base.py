@@ -2,7 +2,7 @@
 Classe de base pour tous les algorithmes
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from graphlabs.core.graph import Graph
@@ -14,6 +14,31 @@ class AlgorithmModule:
     def __init__(self, graph: 'Graph', canvas: 'GraphCanvas'):
         self.graph = graph
         self.canvas = canvas
+        # Marques de visite (un octet par id), réutilisées d'une exécution à l'autre,
+        # et zéros de même taille pour les remettre à zéro sans allocation
+        self._visited_buf: Optional[bytearray] = None
+        self._visited_zeros: Optional[memoryview] = None
+    
+    def _ensure_visited(self, n: int) -> bytearray:
+        """
+        Retourne le tampon de marques de visite, remis à zéro
+        
+        Args:
+            n: Nombre d'ids à couvrir (graph.next_id)
+            
+        Returns:
+            bytearray d'au moins n octets, les n premiers nuls
+        """
+        buf = self._visited_buf
+        if buf is None or len(buf) < n:
+            buf = self._visited_buf = bytearray(n)
+            self._visited_zeros = memoryview(bytes(n))
+        else:
+            # Copie de vue à vue : ni tampon temporaire ni écriture au-delà de n
+            # (bytearray[:n] = ... recopierait d'abord la source)
+            with memoryview(buf) as view:
+                view[:n] = self._visited_zeros[:n]
+        return buf
         
     def run(self, **kwargs) -> str:
         """
@@ -24,7 +49,8 @@ class AlgorithmModule:
         """
         raise NotImplementedError
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """
         Retourne une description pédagogique de l'algorithme
         
@@ -100,7 +100,8 @@ class ConnectedComponentsModule(AlgorithmModule):
         
         return result
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Composantes Connexes :\n\n"
                 "Identifie les groupes de sommets mutuellement accessibles. "
                 "Deux sommets sont dans la même composante s'il existe un chemin entre eux.\n\n"
@@ -212,7 +212,8 @@ class CycleDetectionModule(AlgorithmModule):
         
         return result
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Détection de Cycles :\n\n"
                 "Trouve TOUS les cycles dans le graphe.\n\n"
                 "Algorithmes :\n"
@@ -7,6 +7,8 @@ from graphlabs.algorithms.base import AlgorithmModule
 from typing import List, Dict, Set, Tuple
 from collections import defaultdict
 
+import numpy as np
+
 class EulerianModule(AlgorithmModule):
     """
     Vérifie et construit des circuits/chemins eulériens
@@ -283,30 +285,18 @@ class EulerianModule(AlgorithmModule):
         """Calcule le degré de chaque sommet (ou in/out pour orienté)"""
         if self.graph.directed:
             # Pour graphe orienté : in-degree et out-degree
-            in_deg = defaultdict(int)
-            out_deg = defaultdict(int)
-            
-            for edge in self.graph.edges:
-                out_deg[edge.source] += 1
-                in_deg[edge.target] += 1
+            in_deg = self.graph.in_degrees()
+            out_deg = self.graph.out_degrees()
             
             # Pour eulérien orienté : in_degree doit égaler out_degree
             # On retourne la différence pour analyse
-            degrees = {}
-            all_nodes = set(self.graph.nodes.keys())
-            for node in all_nodes:
-                degrees[node] = (in_deg[node], out_deg[node])
-            
-            return degrees
+            return {node: (int(in_deg[node]), int(out_deg[node])) for node in self.graph.nodes}
         else:
-            # Graphe non-orienté
-            degrees = defaultdict(int)
-            
-            for edge in self.graph.edges:
-                degrees[edge.source] += 1
-                degrees[edge.target] += 1
-            
-            return dict(degrees)
+            # Graphe non-orienté : sommets touchés par une arête,
+            # dans l'ordre de leur première apparition
+            degrees = self.graph.degrees()
+            nodes, first = np.unique(self.graph.edge_endpoints().ravel(), return_index=True)
+            return {node: int(degrees[node]) for node in nodes[np.argsort(first)].tolist()}
     
     def _find_eulerian_circuit(self, start: int) -> List[int]:
         """
@@ -343,7 +333,8 @@ class EulerianModule(AlgorithmModule):
         # Même algorithme mais commence au sommet impair
         return self._find_eulerian_circuit(start)
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Circuit Eulérien :\n\n"
                 "Chemin qui traverse chaque ARÊTE exactement une fois.\n\n"
                 "Théorème d'Euler (1736) :\n"
@@ -0,0 +1,183 @@
+"""
+Noyaux de parcours compilés avec Numba sur l'adjacence CSR
+
+Numba est optionnel : s'il est absent, HAS_NUMBA vaut False, les fonctions
+restent en Python pur et les modules gardent leur propre implémentation.
+SciPy l'est aussi : HAS_SCIPY indique si les parcours compilés de
+scipy.sparse.csgraph peuvent servir de repli. Enfin HAS_CDIJKSTRA indique
+si l'extension C _cdijkstra a été compilée à l'installation.
+"""
+
+import heapq
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Remplace numba.njit par un décorateur sans effet"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy.sparse.csgraph import breadth_first_order, depth_first_order
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+    breadth_first_order = depth_first_order = None
+
+try:
+    from graphlabs.algorithms import _cdijkstra
+    HAS_CDIJKSTRA = True
+except ImportError:
+    HAS_CDIJKSTRA = False
+    _cdijkstra = None
+
+@njit(cache=True)
+def bfs_csr(indptr, indices, start):
+    """
+    Parcours en largeur depuis start
+
+    Args:
+        indptr, indices: Adjacence CSR (voir Graph.to_csr)
+        start: Sommet de départ
+
+    Returns:
+        int32[k] : sommets dans l'ordre de visite
+    """
+    n = indptr.shape[0] - 1
+    visited = np.zeros(n, dtype=np.bool_)
+    # La file contient exactement l'ordre de visite
+    queue = np.empty(n, dtype=np.int32)
+    visited[start] = True
+    queue[0] = start
+    head = 0
+    tail = 1
+
+    while head < tail:
+        node = queue[head]
+        head += 1
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            if not visited[neighbor]:
+                visited[neighbor] = True
+                queue[tail] = neighbor
+                tail += 1
+
+    return queue[:tail]
+
+@njit(cache=True)
+def dfs_csr(indptr, indices, start):
+    """
+    Parcours en profondeur depuis start (même ordre que la version récursive)
+
+    Args:
+        indptr, indices: Adjacence CSR (voir Graph.to_csr)
+        start: Sommet de départ
+
+    Returns:
+        int32[k] : sommets dans l'ordre de visite
+    """
+    n = indptr.shape[0] - 1
+    visited = np.zeros(n, dtype=np.bool_)
+    order = np.empty(n, dtype=np.int32)
+    # Chaque arête est empilée au plus une fois
+    stack = np.empty(indices.shape[0] + 1, dtype=np.int32)
+    stack[0] = start
+    top = 1
+    count = 0
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        if visited[node]:
+            continue
+        visited[node] = True
+        order[count] = node
+        count += 1
+        # Empiler à l'envers pour visiter les voisins dans l'ordre
+        for k in range(indptr[node + 1] - 1, indptr[node] - 1, -1):
+            stack[top] = indices[k]
+            top += 1
+
+    return order[:count]
+
+@njit(cache=True)
+def dijkstra_csr(indptr, indices, weights, start):
+    """
+    Plus courts chemins depuis start (poids positifs)
+
+    Args:
+        indptr, indices, weights: Adjacence CSR (voir Graph.to_csr ; poids
+            float32 ou float64, distances cumulées en float64)
+        start: Sommet de départ
+
+    Returns:
+        Tuple (dist, prev) :
+        - dist : float64[V], distance depuis start (inf si inaccessible)
+        - prev : int32[V], prédécesseur sur le plus court chemin (-1 sinon)
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1, dtype=np.int32)
+    done = np.zeros(n, dtype=np.bool_)
+    dist[start] = 0.0
+    pq = [(0.0, np.int32(start))]
+
+    while len(pq) > 0:
+        curr_dist, curr = heapq.heappop(pq)
+        # Chaque sommet n'est traité qu'une fois (entrées périmées ignorées)
+        if done[curr]:
+            continue
+        done[curr] = True
+        for k in range(indptr[curr], indptr[curr + 1]):
+            neighbor = indices[k]
+            if done[neighbor]:
+                continue
+            # float() : cumul en float64 aussi pour des poids float32
+            distance = curr_dist + float(weights[k])
+            if distance < dist[neighbor]:
+                dist[neighbor] = distance
+                prev[neighbor] = curr
+                heapq.heappush(pq, (distance, neighbor))
+
+    return dist, prev
+
+def dijkstra_native(indptr, indices, weights, start):
+    """
+    Même contrat que dijkstra_csr, calculé par l'extension C _cdijkstra
+
+    À n'appeler que si HAS_CDIJKSTRA est vrai.
+    """
+    n = indptr.shape[0] - 1
+    dist = np.empty(n, dtype=np.float64)
+    prev = np.empty(n, dtype=np.int32)
+    # L'extension lit les poids en float32 ou en float64 sans conversion
+    if weights.dtype != np.float32:
+        weights = np.ascontiguousarray(weights, dtype=np.float64)
+    _cdijkstra.dijkstra(np.ascontiguousarray(indptr, dtype=np.int32),
+                        np.ascontiguousarray(indices, dtype=np.int32),
+                        np.ascontiguousarray(weights),
+                        start, dist, prev)
+    return dist, prev
+
+def warmup():
+    """
+    Charge (ou compile) les noyaux sur un graphe de deux sommets
+
+    Appelée au lancement de l'application pour que le premier parcours
+    demandé par l'utilisateur ne paie pas la compilation. Sans Numba,
+    ne fait rien.
+    """
+    if not HAS_NUMBA:
+        return
+    indptr = np.array([0, 1, 2], dtype=np.int32)
+    indices = np.array([1, 0], dtype=np.int32)
+    weights = np.ones(2, dtype=np.float32)  # type des poids de Graph.to_csr
+    bfs_csr(indptr, indices, 0)
+    dfs_csr(indptr, indices, 0)
+    dijkstra_csr(indptr, indices, weights, 0)
@@ -3,8 +3,51 @@ Algorithme de Dijkstra pour le plus court chemin
 """
 
 import heapq
+import numpy as np
 from graphlabs.algorithms.base import AlgorithmModule
-from typing import Dict, Optional
+from graphlabs.algorithms.kernels import HAS_CDIJKSTRA, HAS_NUMBA, dijkstra_csr, dijkstra_native
+from typing import Dict, Set, Tuple
+
+# Degré moyen à partir duquel la relaxation NumPy bat la boucle Python (mesuré sans Numba)
+DENSE_MEAN_DEGREE = 100
+
+def _dijkstra_vectorized(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                         start: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dijkstra sans Numba : relaxation d'une ligne CSR entière en une opération NumPy
+    
+    Même contrat que kernels.dijkstra_csr (dist float64[V], prev int32[V], -1 si aucun).
+    """
+    n = len(indptr) - 1
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1, dtype=np.int32)
+    done = np.zeros(n, dtype=bool)
+    dist[start] = 0.0
+    pq = [(0.0, start)]
+    
+    while pq:
+        curr_dist, curr = heapq.heappop(pq)
+        # Chaque sommet n'est traité qu'une fois (entrées périmées ignorées)
+        if done[curr]:
+            continue
+        done[curr] = True
+        
+        lo, hi = indptr[curr], indptr[curr + 1]
+        if lo == hi:
+            continue
+        neighbors = indices[lo:hi]
+        # Cumul en float64 même si les poids sont en float32
+        candidates = np.add(weights[lo:hi], curr_dist, dtype=np.float64)
+        better = (candidates < dist[neighbors]) & ~done[neighbors]
+        # Les insertions dans le tas restent séquentielles ; le test est refait
+        # pour les voisins présents plusieurs fois (arêtes parallèles)
+        for neighbor, distance in zip(neighbors[better].tolist(), candidates[better].tolist()):
+            if distance < dist[neighbor]:
+                dist[neighbor] = distance
+                prev[neighbor] = curr
+                heapq.heappush(pq, (distance, neighbor))
+    
+    return dist, prev
 
 class DijkstraModule(AlgorithmModule):
     """Plus court chemin de Dijkstra"""
@@ -33,26 +76,44 @@ class DijkstraModule(AlgorithmModule):
         if start not in self.graph.nodes:
             return f"Erreur : Le sommet de départ {start} n'existe pas dans le graphe"
         
-        distances: Dict[int, float] = {node: float('inf') for node in self.graph.nodes}
-        distances[start] = 0
-        previous: Dict[int, int] = {}
-        pq = [(0, start)]
-        
-        while pq:
-            curr_dist, curr = heapq.heappop(pq)
-            if curr_dist > distances[curr]:
-                continue
-                
-            for neighbor in self.graph.get_neighbors(curr):
-                edge_weight = next((e.weight for e in self.graph.edges 
-                                  if (e.source == curr and e.target == neighbor) or
-                                     (not self.graph.directed and e.target == curr and e.source == neighbor)), 1)
-                distance = curr_dist + edge_weight
-                
-                if distance < distances[neighbor]:
-                    distances[neighbor] = distance
-                    previous[neighbor] = curr
-                    heapq.heappush(pq, (distance, neighbor))
+        arcs = len(self.graph.edges) * (1 if self.graph.directed else 2)
+        if HAS_CDIJKSTRA or HAS_NUMBA or arcs >= DENSE_MEAN_DEGREE * len(self.graph.nodes):
+            indptr, indices, weights = self.graph.to_csr()
+            if HAS_CDIJKSTRA:
+                # Extension C compilée à l'installation (pas de compilation JIT)
+                dist, prev = dijkstra_native(indptr, indices, weights, start)
+            elif HAS_NUMBA:
+                # Noyau compilé sur l'adjacence CSR
+                dist, prev = dijkstra_csr(indptr, indices, weights, start)
+            else:
+                # Graphe dense : relaxation vectorisée ligne par ligne
+                dist, prev = _dijkstra_vectorized(indptr, indices, weights, start)
+            distances: Dict[int, float] = {node: float(dist[node]) for node in self.graph.nodes}
+            previous: Dict[int, int] = {node: int(prev[node]) for node in self.graph.nodes
+                                        if prev[node] >= 0}
+        else:
+            distances = {node: float('inf') for node in self.graph.nodes}
+            distances[start] = 0
+            previous = {}
+            visited: Set[int] = set()
+            pq = [(0, start)]
+            
+            while pq:
+                curr_dist, curr = heapq.heappop(pq)
+                # Chaque sommet n'est traité qu'une fois (entrées périmées ignorées)
+                if curr in visited:
+                    continue
+                visited.add(curr)
+                    
+                for neighbor, edge_weight in self.graph.iter_neighbors_with_weight(curr):
+                    if neighbor in visited:
+                        continue
+                    distance = curr_dist + edge_weight
+                    
+                    if distance < distances[neighbor]:
+                        distances[neighbor] = distance
+                        previous[neighbor] = curr
+                        heapq.heappush(pq, (distance, neighbor))
         
         # Obtenir les labels des sommets
         def get_label(node_id):
@@ -79,14 +140,9 @@ class DijkstraModule(AlgorithmModule):
             
             path.reverse()
             
-            # Surbrillance du chemin
-            self.canvas.highlight_nodes(set(path))
-            
-            # Créer les arêtes du chemin pour la surbrillance
-            path_edges = set()
-            for i in range(len(path) - 1):
-                path_edges.add((path[i], path[i+1]))
-            self.canvas.highlight_edges(path_edges)
+            # Surbrillance du chemin et de ses arêtes (ensembles construits une seule fois)
+            self.canvas.highlight_nodes(frozenset(path))
+            self.canvas.highlight_edges(frozenset(zip(path, path[1:])))
             
             # Formatter le résultat avec labels
             path_labels = [get_label(node) for node in path]
@@ -125,12 +181,13 @@ class DijkstraModule(AlgorithmModule):
                 result += f"  {label:10} : {dist_str:>6}\n"
         
         # NE PAS surbriller tous les sommets, juste le sommet de départ
-        self.canvas.highlight_nodes({start})
-        self.canvas.highlight_edges(set())
+        self.canvas.highlight_nodes(frozenset((start,)))
+        self.canvas.highlight_edges(frozenset())
         
         return result.strip()
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Algorithme de Dijkstra :\n\n"
                 "Trouve le plus court chemin dans un graphe pondéré avec poids positifs. "
                 "Utilise une file de priorité pour explorer les sommets par ordre de distance croissante.\n\n"
@@ -11,7 +11,8 @@ class TemplateModule(AlgorithmModule):
         # TODO: Implémenter
         return "Non implémenté"
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return "Description TODO"
     
     def get_complexity(self) -> str:
@@ -4,7 +4,8 @@ Parcours en Largeur (Breadth-First Search)
 
 from collections import deque
 from graphlabs.algorithms.base import AlgorithmModule
-from typing import Set, List
+from graphlabs.algorithms.kernels import HAS_NUMBA, HAS_SCIPY, bfs_csr, breadth_first_order
+from typing import List
 
 class BFSModule(AlgorithmModule):
     """Parcours en largeur"""
@@ -32,19 +33,30 @@ class BFSModule(AlgorithmModule):
         if start not in self.graph.nodes:
             return f"Erreur : Le sommet {start} n'existe pas dans le graphe"
             
-        visited: Set[int] = {start}
-        queue = deque([start])
-        order: List[int] = []
-        
-        while queue:
-            node = queue.popleft()
-            order.append(node)
-            for neighbor in self.graph.get_neighbors(node):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
+        if HAS_NUMBA:
+            # Noyau compilé sur l'adjacence CSR
+            indptr, indices, _ = self.graph.to_csr()
+            order: List[int] = bfs_csr(indptr, indices, start).tolist()
+        elif HAS_SCIPY:
+            # Parcours compilé de SciPy ; la matrice CSR contient déjà les deux sens
+            # des arêtes non orientées, d'où directed=True
+            order = breadth_first_order(self.graph.to_csr_scipy(), start, directed=True,
+                                       return_predecessors=False).tolist()
+        else:
+            visited = self._ensure_visited(self.graph.next_id)
+            visited[start] = 1
+            queue = deque([start])
+            order = []
+            
+            while queue:
+                node = queue.popleft()
+                order.append(node)
+                for neighbor in self.graph.iter_neighbors(node):
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        queue.append(neighbor)
         
-        self.canvas.highlight_nodes(set(order))
+        self.canvas.highlight_nodes(order)
         
         # Obtenir les labels
         def get_label(node_id):
@@ -55,9 +67,10 @@ class BFSModule(AlgorithmModule):
         
         return (f"BFS depuis le sommet {start_label} :\n\n"
                 f"Ordre de visite : {' → '.join(order_labels)}\n"
-                f"Sommets visités : {len(visited)} / {len(self.graph.nodes)}")
+                f"Sommets visités : {len(order)} / {len(self.graph.nodes)}")
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Parcours en Largeur (BFS) :\n\n"
                 "Explore un graphe niveau par niveau, visitant tous les voisins "
                 "directs avant de passer aux voisins des voisins. Utilise une file.\n\n"
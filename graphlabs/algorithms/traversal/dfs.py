@@ -3,7 +3,8 @@ Parcours en Profondeur (Depth-First Search)
 """
 
 from graphlabs.algorithms.base import AlgorithmModule
-from typing import Set, List
+from graphlabs.algorithms.kernels import HAS_NUMBA, HAS_SCIPY, dfs_csr, depth_first_order
+from typing import List
 
 class DFSModule(AlgorithmModule):
     """Parcours en profondeur"""
@@ -31,18 +32,34 @@ class DFSModule(AlgorithmModule):
         if start not in self.graph.nodes:
             return f"Erreur : Le sommet {start} n'existe pas dans le graphe"
             
-        visited: Set[int] = set()
-        order: List[int] = []
-        
-        def dfs(node: int):
-            visited.add(node)
-            order.append(node)
-            for neighbor in self.graph.get_neighbors(node):
-                if neighbor not in visited:
-                    dfs(neighbor)
+        if HAS_NUMBA:
+            # Noyau compilé sur l'adjacence CSR
+            indptr, indices, _ = self.graph.to_csr()
+            order: List[int] = dfs_csr(indptr, indices, start).tolist()
+        elif HAS_SCIPY:
+            # Parcours compilé de SciPy ; la matrice CSR contient déjà les deux sens
+            # des arêtes non orientées, d'où directed=True
+            order = depth_first_order(self.graph.to_csr_scipy(), start, directed=True,
+                                     return_predecessors=False).tolist()
+        else:
+            visited = self._ensure_visited(self.graph.next_id)
+            visited[start] = 1
+            order = [start]
+            
+            # Pile explicite d'itérateurs de voisins : même ordre que la récursion,
+            # sans limite de profondeur ni liste de voisins construite à chaque visite
+            stack = [self.graph.iter_neighbors(start)]
+            while stack:
+                for neighbor in stack[-1]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        order.append(neighbor)
+                        stack.append(self.graph.iter_neighbors(neighbor))
+                        break
+                else:
+                    stack.pop()
         
-        dfs(start)
-        self.canvas.highlight_nodes(set(order))
+        self.canvas.highlight_nodes(order)
         
         # Obtenir les labels
         def get_label(node_id):
@@ -53,9 +70,10 @@ class DFSModule(AlgorithmModule):
         
         return (f"DFS depuis le sommet {start_label} :\n\n"
                 f"Ordre de visite : {' → '.join(order_labels)}\n"
-                f"Sommets visités : {len(visited)} / {len(self.graph.nodes)}")
+                f"Sommets visités : {len(order)} / {len(self.graph.nodes)}")
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Parcours en Profondeur (DFS) :\n\n"
                 "Explore un graphe en allant le plus loin possible sur chaque branche "
                 "avant de revenir en arrière. Utilise une pile (ou la récursion).\n\n"
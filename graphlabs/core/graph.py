@@ -2,23 +2,38 @@
 Structures de données de base pour les graphes
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Set, Tuple, Optional
+from operator import itemgetter
+from typing import Iterator, List, Dict, Set, Tuple, Optional
+
+import numpy as np
 
-@dataclass
 class Node:
     """Représente un sommet du graphe"""
-    id: int
-    x: float
-    y: float
-    label: str = ""
-    color: str = "#4A90E2"
+    # Attributs fixes : pas de __dict__ par instance (dataclass(slots=True) exige Python 3.10).
+    # Pas figé (frozen) : le graphe modifie ses sommets en place (position,
+    # label, couleur, id renuméroté) et les repère par id, pas par hachage.
+    __slots__ = ("id", "x", "y", "label", "color")
     
-    def __post_init__(self):
+    def __init__(self, id: int, x: float, y: float, label: str = "", color: str = "#4A90E2"):
+        self.id = id
+        self.x = x
+        self.y = y
+        self.label = label
+        self.color = color
         # Générer un label alphabétique par défaut si vide
         if not self.label:
             self.label = self._int_to_letter(self.id)
     
+    def __repr__(self):
+        return (f"Node(id={self.id!r}, x={self.x!r}, y={self.y!r}, "
+                f"label={self.label!r}, color={self.color!r})")
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.id, self.x, self.y, self.label, self.color) ==
+                (other.id, other.x, other.y, other.label, other.color))
+    
     @staticmethod
     def _int_to_letter(n: int) -> str:
         """Convertit un entier en lettre(s) : 0->A, 1->B, ..., 26->AA"""
@@ -30,35 +45,261 @@ class Node:
             n //= 26
         return result
     
-@dataclass
 class Edge:
     """Représente une arête du graphe"""
-    source: int
-    target: int
-    weight: int = 1  # Changé en int pour poids entiers
-    directed: bool = False
-    color: str = "#333333"
+    # Même choix que Node : slots sans gel, le poids et la couleur changent en place
+    __slots__ = ("source", "target", "weight", "directed", "color")
+    
+    def __init__(self, source: int, target: int, weight: int = 1,  # Changé en int pour poids entiers
+                 directed: bool = False, color: str = "#333333"):
+        self.source = source
+        self.target = target
+        self.weight = weight
+        self.directed = directed
+        self.color = color
+    
+    def __repr__(self):
+        return (f"Edge(source={self.source!r}, target={self.target!r}, weight={self.weight!r}, "
+                f"directed={self.directed!r}, color={self.color!r})")
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.source, self.target, self.weight, self.directed, self.color) ==
+                (other.source, other.target, other.weight, other.directed, other.color))
 
 class Graph:
-    """Modèle de graphe avec opérations de base"""
-    def __init__(self, directed=False):
-        self.nodes: Dict[int, Node] = {}
-        self.edges: List[Edge] = []
-        self.directed = directed
+    """
+    Modèle de graphe avec opérations de base
+    
+    Args:
+        directed: Graphe orienté
+        weight_dtype: Type des poids dans to_csr. float32 par défaut : exact pour
+            les entiers jusqu'à 2**24, arrondi au-delà ou pour des décimales
+            (0.1 devient 0.100000001...). Passer np.float64 pour garder la
+            précision des poids Python.
+    """
+    def __init__(self, directed=False, weight_dtype=np.float32):
+        self.weight_dtype = np.dtype(weight_dtype)
+        self._nodes: Dict[int, Node] = {}
+        # Coordonnées des sommets en tableaux contigus indexés par id (capacité doublée)
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._alive = np.zeros(0, dtype=bool)
+        self._edges: List[Edge] = []
+        self._directed = directed
         self.next_id = 0
+        # Index d'adjacence {sommet: [(voisin, poids), ...]}, reconstruit à la demande
+        self._adj: Dict[int, List[Tuple[int, int]]] = {}
+        self._adj_dirty = False
+        # Compteur de modifications : clé des caches dérivés (CSR, ...)
+        self._version = 0
+        self._csr: Optional[Tuple[int, Tuple[np.ndarray, np.ndarray, np.ndarray]]] = None
+        self._csr_scipy = None
+        # (version, {sommet: tuple des voisins}) rempli au fil des appels à get_neighbors
+        self._neighbors: Optional[Tuple[int, Dict[int, Tuple[int, ...]]]] = None
+        # (version, tampon (capacité, 2) à capacité doublée, nombre d'arêtes)
+        self._endpoints: Optional[Tuple[int, np.ndarray, int]] = None
+    
+    @property
+    def nodes(self) -> Dict[int, Node]:
+        """
+        Sommets indexés par id
+        
+        Les coordonnées sont recopiées dans des tableaux NumPy : passer par
+        add_node, move_node, remove_node ou réaffecter le dictionnaire entier.
+        """
+        return self._nodes
+    
+    @nodes.setter
+    def nodes(self, nodes: Dict[int, Node]):
+        self._nodes = nodes
+        self._rebuild_coords()
+        self._version += 1
+    
+    @property
+    def edges(self) -> List[Edge]:
+        """Liste des arêtes (la réaffecter invalide l'index d'adjacence)"""
+        return self._edges
+    
+    @edges.setter
+    def edges(self, edges: List[Edge]):
+        self._edges = edges
+        self._invalidate()
+    
+    @property
+    def directed(self) -> bool:
+        """Graphe orienté ou non (le changer invalide l'index d'adjacence)"""
+        return self._directed
+    
+    @directed.setter
+    def directed(self, directed: bool):
+        """Change l'orientation et marque l'index d'adjacence comme obsolète"""
+        self._directed = directed
+        self._invalidate()
+    
+    def _invalidate(self):
+        """Marque l'index d'adjacence et les caches dérivés comme obsolètes"""
+        self._adj_dirty = True
+        self._version += 1
         
     def add_node(self, x: float, y: float, label: str = "") -> int:
         """Ajoute un sommet au graphe"""
         node_id = self.next_id
         node = Node(node_id, x, y, label)
         self.nodes[node_id] = node
+        self._reserve(node_id + 1)
+        self._x[node_id] = x
+        self._y[node_id] = y
+        self._alive[node_id] = True
         self.next_id += 1
+        self._version += 1
         return node_id
         
+    def move_node(self, node_id: int, x: float, y: float):
+        """Déplace un sommet"""
+        node = self.nodes.get(node_id)
+        if node is not None:
+            node.x = x
+            node.y = y
+            self._x[node_id] = x
+            self._y[node_id] = y
+    
+    def coords(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Retourne les tableaux (x, y) des coordonnées indexés par id (à ne pas modifier)"""
+        return self._x, self._y
+    
+    def node_positions(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Retourne (ids, x, y) des sommets existants, par id croissant"""
+        ids = np.flatnonzero(self._alive)
+        return ids, self._x[ids], self._y[ids]
+    
+    def nodes_in_rect(self, left: float, top: float, right: float, bottom: float) -> np.ndarray:
+        """Retourne les ids (croissants) des sommets situés dans le rectangle donné"""
+        x, y = self._x, self._y
+        inside = self._alive & (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+        return np.flatnonzero(inside)
+    
+    def edges_in_rect(self, left: float, top: float, right: float, bottom: float) -> np.ndarray:
+        """
+        Retourne les indices (dans self.edges) des arêtes qui peuvent couper le rectangle donné
+        
+        Le test porte sur la boîte englobante du segment ; les arêtes dont une
+        extrémité n'existe pas sont exclues.
+        """
+        ends = self.edge_endpoints()
+        src, tgt = ends[:, 0], ends[:, 1]
+        x, y, alive = self._x, self._y, self._alive
+        valid = ((src >= 0) & (tgt >= 0) & (src < len(alive)) & (tgt < len(alive)) &
+                 alive.take(src, mode='clip') & alive.take(tgt, mode='clip'))
+        sx, tx = x.take(src, mode='clip'), x.take(tgt, mode='clip')
+        sy, ty = y.take(src, mode='clip'), y.take(tgt, mode='clip')
+        inside = (valid &
+                  (np.maximum(sx, tx) >= left) & (np.minimum(sx, tx) <= right) &
+                  (np.maximum(sy, ty) >= top) & (np.minimum(sy, ty) <= bottom))
+        return np.flatnonzero(inside)
+    
+    def _reserve(self, size: int):
+        """Agrandit les tableaux de coordonnées pour contenir size ids (capacité doublée)"""
+        if size <= len(self._x):
+            return
+        capacity = max(size, 2 * len(self._x), 16)
+        x = np.zeros(capacity)
+        y = np.zeros(capacity)
+        alive = np.zeros(capacity, dtype=bool)
+        x[:len(self._x)] = self._x
+        y[:len(self._y)] = self._y
+        alive[:len(self._alive)] = self._alive
+        self._x, self._y, self._alive = x, y, alive
+    
+    def _rebuild_coords(self):
+        """Recopie les coordonnées depuis les objets Node"""
+        self._alive = np.zeros(0, dtype=bool)
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        if self._nodes:
+            self._reserve(max(self._nodes) + 1)
+            for node_id, node in self._nodes.items():
+                self._x[node_id] = node.x
+                self._y[node_id] = node.y
+                self._alive[node_id] = True
+        
     def add_edge(self, source: int, target: int, weight: int = 1):
         """Ajoute une arête entre deux sommets"""
         if source in self.nodes and target in self.nodes:
-            self.edges.append(Edge(source, target, weight, self.directed))
+            self._append_edge(Edge(source, target, weight, self.directed))
+    
+    def add_edges_batch(self, edges: np.ndarray, weights: Optional[np.ndarray] = None):
+        """
+        Ajoute plusieurs arêtes en une seule fois
+        
+        Args:
+            edges: Tableau (N, 2) de couples (source, target), ou (N, 3) avec le poids
+                en dernière colonne
+            weights: Poids des N arêtes (1 par défaut, ignoré si edges a 3 colonnes)
+        """
+        edges = np.asarray(edges)
+        if edges.size == 0:
+            return
+        edges = edges.reshape(len(edges), -1)
+        if edges.shape[1] == 3:
+            weights = edges[:, 2]
+        ends = edges[:, :2].astype(np.int64)
+        weights = np.ones(len(ends), dtype=np.int64) if weights is None else np.asarray(weights)
+        
+        # Ignorer les arêtes dont une extrémité n'existe pas (comme add_edge)
+        valid = ((ends >= 0) & (ends < len(self._alive))).all(axis=1)
+        valid[valid] = self._alive[ends[valid]].all(axis=1)
+        ends, weights = ends[valid], weights[valid]
+        if not len(ends):
+            return
+        
+        new_edges = [Edge(source, target, weight, self._directed)
+                     for (source, target), weight in zip(ends.tolist(), weights.tolist())]
+        endpoints_fresh = self._endpoints is not None and self._endpoints[0] == self._version
+        self._edges.extend(new_edges)
+        if not self._adj_dirty:
+            for edge in new_edges:
+                self._index_edge(edge)
+        self._version += 1
+        # Prolonger le tableau des extrémités plutôt que de le reconstruire
+        if endpoints_fresh:
+            self._push_endpoints(ends)
+    
+    def _append_edge(self, edge: Edge):
+        """Ajoute une arête en tenant l'index d'adjacence à jour"""
+        endpoints_fresh = self._endpoints is not None and self._endpoints[0] == self._version
+        self._edges.append(edge)
+        self._version += 1
+        if not self._adj_dirty:
+            self._index_edge(edge)
+        if endpoints_fresh:
+            self._push_endpoints(((edge.source, edge.target),))
+    
+    def _push_endpoints(self, ends):
+        """Ajoute des extrémités au cache de edge_endpoints (à jour avant l'ajout des arêtes)"""
+        _, buffer, count = self._endpoints
+        size = count + len(ends)
+        if size > len(buffer):
+            # Capacité doublée : ajout amorti en O(1)
+            grown = np.empty((max(size, 2 * len(buffer)), 2), dtype=np.int64)
+            grown[:count] = buffer[:count]
+            buffer = grown
+        buffer[count:size] = ends
+        self._endpoints = (self._version, buffer, size)
+    
+    def _index_edge(self, edge: Edge):
+        """Enregistre une arête dans l'index d'adjacence"""
+        self._adj.setdefault(edge.source, []).append((edge.target, edge.weight))
+        if not self._directed and edge.source != edge.target:
+            self._adj.setdefault(edge.target, []).append((edge.source, edge.weight))
+    
+    def _rebuild_adj(self):
+        """Reconstruit l'index d'adjacence en un seul passage sur les arêtes"""
+        self._adj = {}
+        self._adj_dirty = False
+        for edge in self._edges:
+            self._index_edge(edge)
     
     def update_node_label(self, node_id: int, label: str):
         """Met à jour le label d'un sommet"""
@@ -79,41 +320,261 @@ class Graph:
         edge = self.get_edge(source, target)
         if edge:
             edge.weight = weight
+            self._invalidate()
             
     def remove_node(self, node_id: int):
         """Supprime un sommet et toutes ses arêtes"""
         if node_id in self.nodes:
             del self.nodes[node_id]
-            self.edges = [e for e in self.edges if e.source != node_id and e.target != node_id]
+            self._alive[node_id] = False
+            self._discard_edges(lambda e: e.source == node_id or e.target == node_id)
+            if not self._adj_dirty:
+                self._adj.pop(node_id, None)
+            self._version += 1
             
     def remove_edge(self, source: int, target: int):
         """Supprime une arête"""
-        self.edges = [e for e in self.edges if not (e.source == source and e.target == target)]
+        self._discard_edges(lambda e: e.source == source and e.target == target)
+    
+    def _discard_edges(self, predicate):
+        """Retire sur place les arêtes vérifiant predicate et les sort de l'index"""
+        edges = self._edges
+        kept = 0
+        for edge in edges:
+            if predicate(edge):
+                if not self._adj_dirty:
+                    self._unindex_edge(edge)
+            else:
+                edges[kept] = edge
+                kept += 1
+        if kept < len(edges):
+            del edges[kept:]
+            self._version += 1
+    
+    def _unindex_edge(self, edge: Edge):
+        """Retire une arête de l'index d'adjacence, en O(degré)"""
+        rows = [(edge.source, (edge.target, edge.weight))]
+        if not self._directed and edge.source != edge.target:
+            rows.append((edge.target, (edge.source, edge.weight)))
+        for node_id, entry in rows:
+            row = self._adj.get(node_id, [])
+            # Avec des arêtes parallèles identiques, la position de l'entrée à retirer
+            # (donc l'ordre des voisins) n'est pas connue : reconstruction différée
+            if row.count(entry) != 1:
+                self._adj_dirty = True
+                return
+        for node_id, entry in rows:
+            self._adj[node_id].remove(entry)
         
-    def get_neighbors(self, node_id: int) -> List[int]:
-        """Retourne la liste des voisins d'un sommet"""
-        neighbors = []
-        for edge in self.edges:
-            if edge.source == node_id:
-                neighbors.append(edge.target)
-            elif not self.directed and edge.target == node_id:
-                neighbors.append(edge.source)
+    def get_neighbors(self, node_id: int) -> Tuple[int, ...]:
+        """Retourne les voisins d'un sommet (tuple en cache jusqu'à la prochaine modification)"""
+        cache = self._neighbors
+        if cache is None or cache[0] != self._version:
+            cache = self._neighbors = (self._version, {})
+        neighbors = cache[1].get(node_id)
+        if neighbors is None:
+            if self._adj_dirty:
+                self._rebuild_adj()
+            neighbors = cache[1][node_id] = tuple(map(itemgetter(0), self._adj.get(node_id, ())))
         return neighbors
+    
+    def get_neighbors_with_weight(self, node_id: int) -> List[Tuple[int, int]]:
+        """Retourne la liste des couples (voisin, poids) d'un sommet"""
+        if self._adj_dirty:
+            self._rebuild_adj()
+        return list(self._adj.get(node_id, ()))
+    
+    def iter_neighbors(self, node_id: int) -> Iterator[int]:
+        """Parcourt les voisins d'un sommet sans construire de liste"""
+        if self._adj_dirty:
+            self._rebuild_adj()
+        return map(itemgetter(0), self._adj.get(node_id, ()))
+    
+    def iter_neighbors_with_weight(self, node_id: int) -> Iterator[Tuple[int, int]]:
+        """Parcourt les couples (voisin, poids) d'un sommet sans construire de liste"""
+        if self._adj_dirty:
+            self._rebuild_adj()
+        return iter(self._adj.get(node_id, ()))
+    
+    def to_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retourne l'adjacence au format CSR
+        
+        La ligne i correspond au sommet d'id i (ligne vide pour un id supprimé).
+        Le résultat est mis en cache jusqu'à la prochaine modification du graphe.
+        
+        Returns:
+            Tuple (indptr, indices, weights) :
+            - indptr : int32[V + 1], début de chaque ligne dans indices
+            - indices : int32[E'], voisins dans l'ordre de get_neighbors
+            - weights : weight_dtype[E'] (float32 par défaut), poids des arêtes
+              correspondantes ; les distances restent cumulées en float64
+        """
+        if self._csr is not None and self._csr[0] == self._version:
+            return self._csr[1]
+        if self._adj_dirty:
+            self._rebuild_adj()
+        
+        n = max(self.next_id, max(self._adj, default=-1) + 1)
+        counts = np.zeros(n + 1, dtype=np.int32)
+        for node_id, pairs in self._adj.items():
+            counts[node_id + 1] = len(pairs)
+        indptr = np.cumsum(counts, dtype=np.int32)
+        
+        pairs = [pair for node_id in sorted(self._adj) for pair in self._adj[node_id]]
+        indices = np.fromiter((v for v, _ in pairs), dtype=np.int32, count=len(pairs))
+        weights = np.fromiter((w for _, w in pairs), dtype=self.weight_dtype, count=len(pairs))
+        
+        self._csr = (self._version, (indptr, indices, weights))
+        return self._csr[1]
+    
+    def to_csr_scipy(self):
+        """
+        Retourne l'adjacence sous forme de scipy.sparse.csr_matrix (SciPy requis)
+        
+        Même structure que to_csr (doublons et ordre des voisins conservés),
+        mise en cache jusqu'à la prochaine modification du graphe. Les poids
+        sont en float64 quel que soit weight_dtype : csgraph convertit tout autre
+        type et trie alors les colonnes, ce qui changerait l'ordre des parcours.
+        """
+        from scipy.sparse import csr_matrix
+        
+        if self._csr_scipy is None or self._csr_scipy[0] != self._version:
+            indptr, indices, weights = self.to_csr()
+            n = len(indptr) - 1
+            matrix = csr_matrix((weights.astype(np.float64), indices, indptr), shape=(n, n))
+            self._csr_scipy = (self._version, matrix)
+        return self._csr_scipy[1]
+        
+    def degrees(self) -> np.ndarray:
+        """Retourne le degré de chaque sommet, indexé par id (boucle comptée deux fois)"""
+        return np.bincount(self.edge_endpoints().ravel(), minlength=self.next_id)
+    
+    def in_degrees(self) -> np.ndarray:
+        """Retourne le degré entrant de chaque sommet, indexé par id"""
+        return np.bincount(self.edge_endpoints()[:, 1], minlength=self.next_id)
+    
+    def out_degrees(self) -> np.ndarray:
+        """Retourne le degré sortant de chaque sommet, indexé par id"""
+        return np.bincount(self.edge_endpoints()[:, 0], minlength=self.next_id)
+    
+    def edge_endpoints(self) -> np.ndarray:
+        """Retourne un tableau (E, 2) des extrémités (source, target) des arêtes (en cache, lecture seule)"""
+        if self._endpoints is not None and self._endpoints[0] == self._version:
+            _, buffer, count = self._endpoints
+        else:
+            count = len(self.edges)
+            buffer = np.empty((max(count, 16), 2), dtype=np.int64)
+            buffer[:count] = np.fromiter((v for e in self.edges for v in (e.source, e.target)),
+                                         dtype=np.int64, count=2 * count).reshape(-1, 2)
+            self._endpoints = (self._version, buffer, count)
+        # Vue en lecture seule : les ajouts suivants écrivent au-delà de count
+        ends = buffer[:count]
+        ends.flags.writeable = False
+        return ends
+        
+    def get_adjacency_matrix(self) -> np.ndarray:
+        """
+        Retourne la matrice d'adjacence (inf = pas d'arête, 0 sur la diagonale)
         
-    def get_adjacency_matrix(self) -> List[List[float]]:
-        """Retourne la matrice d'adjacence"""
+        Les lignes et colonnes suivent l'ordre de self.nodes, ce qui reste valable
+        quand des ids ont été libérés par remove_node.
+        """
         n = len(self.nodes)
-        matrix = [[float('inf')] * n for _ in range(n)]
-        for i in range(n):
-            matrix[i][i] = 0
-        for edge in self.edges:
-            matrix[edge.source][edge.target] = edge.weight
-            if not self.directed:
-                matrix[edge.target][edge.source] = edge.weight
+        ids = np.fromiter(self.nodes, dtype=np.int64, count=n)
+        matrix = np.full((n, n), np.inf)
+        np.fill_diagonal(matrix, 0)
+        if not self.edges or n == 0:
+            return matrix
+        
+        # Renumérotation id -> ligne (-1 pour un id inconnu)
+        endpoints = self.edge_endpoints()
+        row = np.full(max(ids.max(), endpoints.max()) + 1, -1, dtype=np.int64)
+        row[ids] = np.arange(n)
+        ends = row[endpoints]
+        weights = np.fromiter((e.weight for e in self.edges), dtype=np.float64,
+                              count=len(self.edges))
+        valid = (ends >= 0).all(axis=1)
+        ends, weights = ends[valid], weights[valid]
+        
+        if self.directed:
+            matrix[ends[:, 0], ends[:, 1]] = weights
+        else:
+            # Les deux sens entrelacés : la dernière arête l'emporte, comme en boucle
+            matrix[ends.ravel(), ends[:, ::-1].ravel()] = np.repeat(weights, 2)
         return matrix
         
+    def compact(self, permutation: Optional[np.ndarray] = None) -> Dict[int, int]:
+        """
+        Renumérote les sommets en ids contigus 0..V-1
+        
+        Sans permutation, l'ordre suit Cuthill-McKee inverse : des sommets voisins
+        reçoivent des ids proches, donc des lignes CSR proches. Labels, positions
+        et ordre des arêtes sont conservés.
+        
+        Args:
+            permutation: Ids actuels des sommets dans leur nouvel ordre (optionnel)
+            
+        Returns:
+            Correspondance {ancien id: nouvel id}
+        """
+        if permutation is None:
+            order = self._rcm_order()
+        else:
+            order = [int(node_id) for node_id in permutation]
+            if sorted(order) != sorted(self.nodes):
+                raise ValueError("La permutation doit contenir chaque sommet exactement une fois")
+        
+        mapping = {old: new for new, old in enumerate(order)}
+        nodes = {}
+        for old in order:
+            node = self.nodes[old]
+            node.id = mapping[old]
+            nodes[node.id] = node
+        for edge in self._edges:
+            edge.source = mapping[edge.source]
+            edge.target = mapping[edge.target]
+        
+        self.next_id = len(order)
+        self.nodes = nodes
+        self._invalidate()
+        return mapping
+    
+    def _rcm_order(self) -> List[int]:
+        """Ordre de Cuthill-McKee inverse (parcours en largeur depuis les sommets de plus petit degré)"""
+        # Structure symétrisée : le sens des arêtes n'importe pas pour la localité
+        neighbors: Dict[int, Set[int]] = {node_id: set() for node_id in self.nodes}
+        for edge in self._edges:
+            if edge.source != edge.target:
+                neighbors[edge.source].add(edge.target)
+                neighbors[edge.target].add(edge.source)
+        degree = {node_id: len(nbrs) for node_id, nbrs in neighbors.items()}
+        
+        order: List[int] = []
+        seen: Set[int] = set()
+        for root in sorted(self.nodes, key=degree.__getitem__):
+            if root in seen:
+                continue
+            seen.add(root)
+            head = len(order)
+            order.append(root)
+            # order sert de file : les sommets y sont ajoutés dans l'ordre de visite
+            while head < len(order):
+                node = order[head]
+                head += 1
+                for neighbor in sorted(neighbors[node] - seen, key=degree.__getitem__):
+                    seen.add(neighbor)
+                    order.append(neighbor)
+        
+        order.reverse()
+        return order
+        
     def clear(self):
         """Efface tout le graphe"""
         self.nodes.clear()
-        self.edges.clear()
+        self._alive[:] = False
+        self._edges.clear()
+        self._adj.clear()
+        self._adj_dirty = False
+        self._version += 1
         self.next_id = 0
\ No newline at end of file
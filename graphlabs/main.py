@@ -2,14 +2,22 @@
 Point d'entrée principal de GraphLabs
 """
 
+import os
 import sys
-from PyQt6.QtWidgets import QApplication
-from graphlabs.ui.main_window import GraphLabsWindow
 
 def main():
     """Lance l'application GraphLabs"""
+    # Imports différés : importer graphlabs.main ne charge ni Qt ni numpy
+    from PyQt6.QtWidgets import QApplication
+    from graphlabs.ui.main_window import GraphLabsWindow
+    from graphlabs.algorithms.kernels import warmup
+    
+    # Compiler les noyaux Numba avant le premier clic sur « Exécuter »
+    warmup()
+    # Style choisi à la construction de QApplication plutôt qu'appliqué après
+    # (QT_STYLE_OVERRIDE déjà défini par l'utilisateur reste prioritaire)
+    os.environ.setdefault("QT_STYLE_OVERRIDE", "Fusion")
     app = QApplication(sys.argv)
-    app.setStyle('Fusion')
     window = GraphLabsWindow()
     window.show()
     sys.exit(app.exec())
@@ -3,14 +3,42 @@ Canvas de dessin interactif pour les graphes
 """
 
 import math
-from typing import Optional, Set, Tuple
+from typing import AbstractSet, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 from PyQt6.QtWidgets import QWidget, QMenu, QInputDialog
-from PyQt6.QtCore import Qt, QRectF
-from PyQt6.QtGui import QPainter, QPen, QColor, QBrush, QFont, QAction
+from PyQt6.QtCore import Qt, QLine, QPoint, QRect, QRectF
+from PyQt6.QtGui import QPainter, QPen, QColor, QBrush, QFont, QAction, QPixmap
 
 from graphlabs.core.graph import Graph
 from graphlabs.core.constants import *
 
+# Débord maximal d'un élément hors de ses points (contour, flèche, poids)
+PAINT_MARGIN = NODE_RADIUS + 4
+
+# Flèches des arêtes orientées : longueur des ailes et rotation de ±30°
+ARROW_SIZE = 15
+COS30 = math.sqrt(3) / 2
+SIN30 = 0.5
+
+class TempEdgeOverlay(QWidget):
+    """Calque transparent qui dessine seulement l'arête en cours de création"""
+    
+    def __init__(self, canvas: 'GraphCanvas'):
+        super().__init__(canvas)
+        self.canvas = canvas
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        
+    def paintEvent(self, event):
+        """Dessine la ligne pointillée du sommet de départ au curseur"""
+        line = self.canvas._temp_edge_line()
+        if line is None:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.canvas._pen_temp)
+        painter.drawLine(line)
+
 class GraphCanvas(QWidget):
     """Zone de dessin interactive pour le graphe"""
     
@@ -20,12 +48,35 @@ class GraphCanvas(QWidget):
         self.selected_node: Optional[int] = None
         self.selected_edge: Optional[Tuple[int, int]] = None
         self.dragging_node: Optional[int] = None
+        self._drag_ids: Optional[np.ndarray] = None
         self.temp_edge_start: Optional[int] = None
+        self._temp_edge_end = QPoint()
         self.mode = "select"
         self.edge_weight = 1
-        self.highlighted_nodes: Set[int] = set()
-        self.highlighted_edges: Set[Tuple[int, int]] = set()
+        self.highlighted_nodes: AbstractSet[int] = frozenset()
+        self.highlighted_edges: AbstractSet[Tuple[int, int]] = frozenset()
+        
+        # Objets de dessin construits une fois (et non à chaque paintEvent)
+        self._pen_edge_hl = QPen(QColor(COLOR_EDGE_HIGHLIGHTED), 3)
+        self._pen_edge_sel = QPen(QColor("#FF9500"), 4)
+        self._pen_outline = QPen(QColor("#000000"), 2)
+        self._pen_text = QPen(QColor("#000000"))
+        self._pen_label = QPen(QColor("#FFFFFF"))
+        self._pen_temp = QPen(QColor("#999999"), 2, Qt.PenStyle.DashLine)
+        self._brush_sel = QBrush(QColor(COLOR_NODE_SELECTED))
+        self._brush_hl = QBrush(QColor(COLOR_NODE_HIGHLIGHTED))
+        self._brush_weight = QBrush(QColor("#FFFFFF"))
+        self._brush_none = QBrush()
+        self._font_weight = QFont("Arial", 10, QFont.Weight.Bold)
+        self._font_label = QFont("Arial", 12, QFont.Weight.Bold)
+        self._pen_cache: Dict[str, QPen] = {}
+        self._brush_cache: Dict[str, QBrush] = {}
+        # Rendu du graphe réutilisé tant que update() n'est pas appelé
+        self._layer: Optional[QPixmap] = None
+        
         self.setMinimumSize(CANVAS_MIN_WIDTH, CANVAS_MIN_HEIGHT)
+        # Arête temporaire peinte à part : la suivre ne repeint pas le graphe entier
+        self._temp_overlay = TempEdgeOverlay(self)
         self.setMouseTracking(True)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
@@ -41,34 +92,84 @@ class GraphCanvas(QWidget):
         """Définit le poids pour les prochaines arêtes"""
         self.edge_weight = weight
         
+    def update(self, *args):
+        """Demande un repaint ; le calque du graphe mis en cache est à refaire"""
+        # Tout code qui modifie le graphe ou son affichage appelle update() :
+        # les repaints internes à Qt (exposition, calque de l'arête temporaire)
+        # n'y passent pas et réutilisent le calque
+        self._layer = None
+        super().update(*args)
+    
     def paintEvent(self, event):
-        """Dessine le graphe"""
+        """Dessine le graphe, depuis le calque en cache si possible"""
+        rect = event.rect()
+        if self._layer is None and rect.contains(self.rect()):
+            # Repaint complet : le rendre une fois dans le calque
+            ratio = self.devicePixelRatioF()
+            layer = QPixmap(self.size() * ratio)
+            layer.setDevicePixelRatio(ratio)
+            layer.fill(Qt.GlobalColor.transparent)
+            layer_painter = QPainter(layer)
+            self._paint_graph(layer_painter, rect)
+            layer_painter.end()
+            self._layer = layer
+        
         painter = QPainter(self)
+        if self._layer is not None:
+            painter.drawPixmap(0, 0, self._layer)
+        else:
+            # Repaint partiel (déplacement d'un sommet) : dessin direct de la zone
+            self._paint_graph(painter, rect)
+    
+    def _paint_graph(self, painter: QPainter, dirty: QRect):
+        """Dessine les arêtes et sommets qui touchent la zone dirty"""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Dessiner les arêtes
-        for edge in self.graph.edges:
-            if edge.source not in self.graph.nodes or edge.target not in self.graph.nodes:
-                continue
-                
-            src = self.graph.nodes[edge.source]
-            tgt = self.graph.nodes[edge.target]
+        # Coordonnées lues une seule fois depuis les tableaux du graphe
+        x_arr, y_arr = self.graph.coords()
+        xs, ys = x_arr.tolist(), y_arr.tolist()
+        
+        # Zone à repeindre : les arêtes et sommets entièrement en dehors sont écartés
+        # en une passe vectorisée sur les tableaux du graphe
+        left, top = dirty.left() - PAINT_MARGIN, dirty.top() - PAINT_MARGIN
+        right, bottom = dirty.right() + PAINT_MARGIN, dirty.bottom() + PAINT_MARGIN
+        
+        # Dessiner les arêtes : segments regroupés par stylo, un drawLines par groupe
+        edges = self.graph.edges
+        lines: Dict[str, List[QLine]] = {}
+        highlighted_lines: List[QLine] = []
+        decorated = []  # Arêtes avec flèche ou poids, dessinés après les segments
+        for index in self.graph.edges_in_rect(left, top, right, bottom).tolist():
+            edge = edges[index]
+            x1, y1 = xs[edge.source], ys[edge.source]
+            x2, y2 = xs[edge.target], ys[edge.target]
+            line = QLine(int(x1), int(y1), int(x2), int(y2))
             
             is_highlighted = (edge.source, edge.target) in self.highlighted_edges
-            pen_color = QColor(COLOR_EDGE_HIGHLIGHTED if is_highlighted else edge.color)
-            pen = QPen(pen_color, 3 if is_highlighted else 2)
-            painter.setPen(pen)
-            
-            painter.drawLine(int(src.x), int(src.y), int(tgt.x), int(tgt.y))
-            
+            if is_highlighted:
+                highlighted_lines.append(line)
+            else:
+                lines.setdefault(edge.color, []).append(line)
+            if edge.directed or edge.weight != 1:
+                decorated.append((edge, is_highlighted, x1, y1, x2, y2))
+        
+        for color, batch in lines.items():
+            painter.setPen(self._edge_pen(color))
+            painter.drawLines(batch)
+        if highlighted_lines:
+            painter.setPen(self._pen_edge_hl)
+            painter.drawLines(highlighted_lines)
+        
+        for edge, is_highlighted, x1, y1, x2, y2 in decorated:
             if edge.directed:
-                self._draw_arrow(painter, src.x, src.y, tgt.x, tgt.y)
+                painter.setPen(self._pen_edge_hl if is_highlighted else self._edge_pen(edge.color))
+                self._draw_arrow(painter, x1, y1, x2, y2)
                 
             # Poids de l'arête (affichage amélioré)
             if edge.weight != 1:
-                mid_x, mid_y = (src.x + tgt.x) / 2, (src.y + tgt.y) / 2
-                painter.setPen(QPen(QColor("#000000")))
-                painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+                mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
+                painter.setPen(self._pen_text)
+                painter.setFont(self._font_weight)
                 
                 # Fond blanc pour meilleure lisibilité
                 text = str(edge.weight)
@@ -76,68 +177,100 @@ class GraphCanvas(QWidget):
                 text_width = metrics.horizontalAdvance(text)
                 text_height = metrics.height()
                 
-                painter.setBrush(QBrush(QColor("#FFFFFF")))
+                painter.setBrush(self._brush_weight)
                 painter.drawRect(int(mid_x - text_width/2 - 2), int(mid_y - text_height/2), 
                                text_width + 4, text_height)
                 
-                painter.setBrush(QBrush())
+                painter.setBrush(self._brush_none)
                 painter.drawText(int(mid_x - text_width/2), int(mid_y + text_height/4), text)
         
         # Arête sélectionnée (afficher en orange)
         if self.selected_edge is not None:
             src_id, tgt_id = self.selected_edge
             if src_id in self.graph.nodes and tgt_id in self.graph.nodes:
-                src = self.graph.nodes[src_id]
-                tgt = self.graph.nodes[tgt_id]
-                painter.setPen(QPen(QColor("#FF9500"), 4))
-                painter.drawLine(int(src.x), int(src.y), int(tgt.x), int(tgt.y))
+                painter.setPen(self._pen_edge_sel)
+                painter.drawLine(int(xs[src_id]), int(ys[src_id]), int(xs[tgt_id]), int(ys[tgt_id]))
         
         # Dessiner les sommets
-        for node_id, node in self.graph.nodes.items():
+        painter.setFont(self._font_label)
+        nodes = self.graph.nodes
+        for node_id in self.graph.nodes_in_rect(left, top, right, bottom).tolist():
+            node = nodes[node_id]
+            x, y = xs[node_id], ys[node_id]
             is_highlighted = node_id in self.highlighted_nodes
             is_selected = node_id == self.selected_node
             
             if is_selected:
-                brush = QBrush(QColor(COLOR_NODE_SELECTED))
+                brush = self._brush_sel
             elif is_highlighted:
-                brush = QBrush(QColor(COLOR_NODE_HIGHLIGHTED))
+                brush = self._brush_hl
             else:
-                brush = QBrush(QColor(node.color))
+                brush = self._node_brush(node.color)
                 
             painter.setBrush(brush)
-            painter.setPen(QPen(QColor("#000000"), 2))
+            painter.setPen(self._pen_outline)
             
-            painter.drawEllipse(int(node.x - NODE_RADIUS), int(node.y - NODE_RADIUS), 
+            painter.drawEllipse(int(x - NODE_RADIUS), int(y - NODE_RADIUS), 
                               NODE_RADIUS * 2, NODE_RADIUS * 2)
             
-            painter.setPen(QPen(QColor("#FFFFFF")))
-            painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            painter.drawText(QRectF(node.x - NODE_RADIUS, node.y - NODE_RADIUS, 
+            painter.setPen(self._pen_label)
+            painter.drawText(QRectF(x - NODE_RADIUS, y - NODE_RADIUS, 
                                    NODE_RADIUS * 2, NODE_RADIUS * 2),
                            Qt.AlignmentFlag.AlignCenter, node.label)
         
-        # Arête temporaire
-        if self.temp_edge_start is not None and self.mode == "add_edge":
-            painter.setPen(QPen(QColor("#999999"), 2, Qt.PenStyle.DashLine))
-            start_node = self.graph.nodes[self.temp_edge_start]
-            cursor_pos = self.mapFromGlobal(self.cursor().pos())
-            painter.drawLine(int(start_node.x), int(start_node.y), 
-                           cursor_pos.x(), cursor_pos.y())
+    
+    def resizeEvent(self, event):
+        """Garde le calque de l'arête temporaire à la taille du canvas"""
+        super().resizeEvent(event)
+        self._layer = None
+        self._temp_overlay.resize(self.size())
+    
+    def _temp_edge_line(self) -> Optional[QLine]:
+        """Segment de l'arête en cours de création, ou None"""
+        start = self.temp_edge_start
+        if start is None or self.mode != "add_edge" or start not in self.graph.nodes:
+            return None
+        node = self.graph.nodes[start]
+        return QLine(QPoint(int(node.x), int(node.y)), self._temp_edge_end)
+    
+    def _temp_edge_rect(self) -> QRect:
+        """Rectangle couvrant l'arête temporaire (vide s'il n'y en a pas)"""
+        line = self._temp_edge_line()
+        if line is None:
+            return QRect()
+        return QRect(line.p1(), line.p2()).normalized().adjusted(-3, -3, 3, 3)
+    
+    def _edge_pen(self, color: str) -> QPen:
+        """Retourne le stylo (mis en cache) d'une arête de cette couleur"""
+        pen = self._pen_cache.get(color)
+        if pen is None:
+            pen = self._pen_cache[color] = QPen(QColor(color), 2)
+        return pen
+    
+    def _node_brush(self, color: str) -> QBrush:
+        """Retourne la brosse (mise en cache) d'un sommet de cette couleur"""
+        brush = self._brush_cache.get(color)
+        if brush is None:
+            brush = self._brush_cache[color] = QBrush(QColor(color))
+        return brush
                            
     def _draw_arrow(self, painter, x1, y1, x2, y2):
         """Dessine une flèche pour les graphes orientés"""
-        angle = math.atan2(y2 - y1, x2 - x1)
-        arrow_size = 15
+        dx, dy = x2 - x1, y2 - y1
+        dist = math.hypot(dx, dy)
+        if dist == 0:
+            return
+        ux, uy = dx / dist, dy / dist
         
-        dist = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-        ratio = (dist - NODE_RADIUS) / dist if dist > 0 else 0
-        arrow_x = x1 + (x2 - x1) * ratio
-        arrow_y = y1 + (y2 - y1) * ratio
+        # Pointe au bord du sommet cible
+        arrow_x = x2 - ux * NODE_RADIUS
+        arrow_y = y2 - uy * NODE_RADIUS
         
-        p1_x = arrow_x - arrow_size * math.cos(angle - math.pi / 6)
-        p1_y = arrow_y - arrow_size * math.sin(angle - math.pi / 6)
-        p2_x = arrow_x - arrow_size * math.cos(angle + math.pi / 6)
-        p2_y = arrow_y - arrow_size * math.sin(angle + math.pi / 6)
+        # Ailes : -u tourné de ±30°, sans fonction trigonométrique
+        p1_x = arrow_x - ARROW_SIZE * (ux * COS30 + uy * SIN30)
+        p1_y = arrow_y - ARROW_SIZE * (uy * COS30 - ux * SIN30)
+        p2_x = arrow_x - ARROW_SIZE * (ux * COS30 - uy * SIN30)
+        p2_y = arrow_y - ARROW_SIZE * (uy * COS30 + ux * SIN30)
         
         painter.drawLine(int(arrow_x), int(arrow_y), int(p1_x), int(p1_y))
         painter.drawLine(int(arrow_x), int(arrow_y), int(p2_x), int(p2_y))
@@ -157,6 +290,7 @@ class GraphCanvas(QWidget):
             if clicked_node is not None:
                 if self.temp_edge_start is None:
                     self.temp_edge_start = clicked_node
+                    self._temp_edge_end = event.position().toPoint()
                 else:
                     if self.temp_edge_start != clicked_node:
                         self.graph.add_edge(self.temp_edge_start, clicked_node, self.edge_weight)
@@ -177,6 +311,7 @@ class GraphCanvas(QWidget):
                 self.selected_node = clicked_node
                 self.selected_edge = None
                 self.dragging_node = clicked_node
+                self._drag_ids = self._incident_ids(clicked_node)
             elif clicked_edge is not None:
                 self.selected_edge = clicked_edge
                 self.selected_node = None
@@ -190,23 +325,50 @@ class GraphCanvas(QWidget):
         if self.dragging_node is not None and self.mode == "select":
             x, y = event.position().x(), event.position().y()
             if self.dragging_node in self.graph.nodes:
-                self.graph.nodes[self.dragging_node].x = x
-                self.graph.nodes[self.dragging_node].y = y
-                self.update()
+                # Ne repeindre que l'ancienne et la nouvelle zone du sommet et de ses arêtes
+                old_rect = self._incident_bbox(self.dragging_node)
+                self.graph.move_node(self.dragging_node, x, y)
+                self.update(old_rect.united(self._incident_bbox(self.dragging_node)))
         elif self.mode == "add_edge" and self.temp_edge_start is not None:
-            self.update()
+            # Ne repeindre que l'ancienne et la nouvelle position de la ligne
+            old_rect = self._temp_edge_rect()
+            self._temp_edge_end = event.position().toPoint()
+            self._temp_overlay.update(old_rect.united(self._temp_edge_rect()))
             
     def mouseReleaseEvent(self, event):
         """Gère le relâchement de la souris"""
         self.dragging_node = None
+        self._drag_ids = None
+    
+    def _incident_ids(self, node_id: int) -> np.ndarray:
+        """Retourne l'id du sommet et ceux des extrémités de ses arêtes (entrantes comprises)"""
+        ids = {node_id}
+        for edge in self.graph.edges:
+            if edge.source == node_id:
+                ids.add(edge.target)
+            elif edge.target == node_id:
+                ids.add(edge.source)
+        return np.fromiter(ids, dtype=np.int64, count=len(ids))
+    
+    def _incident_bbox(self, node_id: int) -> QRect:
+        """Rectangle couvrant un sommet et ses arêtes incidentes, marges comprises"""
+        if node_id == self.dragging_node and self._drag_ids is not None:
+            ids = self._drag_ids
+        else:
+            ids = self._incident_ids(node_id)
+        xs, ys = self.graph.coords()
+        x, y = xs[ids], ys[ids]
+        return QRect(QPoint(math.floor(x.min()) - PAINT_MARGIN, math.floor(y.min()) - PAINT_MARGIN),
+                     QPoint(math.ceil(x.max()) + PAINT_MARGIN, math.ceil(y.max()) + PAINT_MARGIN))
         
     def _find_node_at(self, x: float, y: float) -> Optional[int]:
         """Trouve le sommet à une position donnée"""
-        for node_id, node in self.graph.nodes.items():
-            dist = math.sqrt((node.x - x)**2 + (node.y - y)**2)
-            if dist <= NODE_RADIUS:
-                return node_id
-        return None
+        ids, xs, ys = self.graph.node_positions()
+        dx = xs - x
+        dy = ys - y
+        # Comparaison des distances au carré, sans racine
+        hits = np.flatnonzero(dx * dx + dy * dy <= NODE_RADIUS * NODE_RADIUS)
+        return int(ids[hits[0]]) if len(hits) else None
     
     def _find_edge_at(self, x: float, y: float) -> Optional[Tuple[int, int]]:
         """Trouve une arête proche du point cliqué"""
@@ -332,20 +494,21 @@ class GraphCanvas(QWidget):
         self.selected_edge = None
         self.update()
         
-    def highlight_nodes(self, node_ids: Set[int]):
-        """Met en surbrillance des sommets"""
-        self.highlighted_nodes = node_ids
+    def highlight_nodes(self, node_ids: Iterable[int]):
+        """Met en surbrillance des sommets (un ensemble reçu est partagé, pas copié)"""
+        self.highlighted_nodes = node_ids if isinstance(node_ids, AbstractSet) else frozenset(node_ids)
         self.update()
         
-    def highlight_edges(self, edges: Set[Tuple[int, int]]):
+    def highlight_edges(self, edges: AbstractSet[Tuple[int, int]]):
         """Met en surbrillance des arêtes"""
         self.highlighted_edges = edges
         self.update()
         
     def clear_highlights(self):
         """Efface toutes les surbrillances"""
-        self.highlighted_nodes.clear()
-        self.highlighted_edges.clear()
+        # Réaffecter plutôt que vider : les ensembles peuvent appartenir à l'appelant
+        self.highlighted_nodes = frozenset()
+        self.highlighted_edges = frozenset()
         self.update()
 
     def _notify_graph_changed(self):
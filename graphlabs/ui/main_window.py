@@ -30,6 +30,8 @@ class GraphLabsWindow(QMainWindow):
         super().__init__()
         self.graph = Graph()
         self.current_file = None
+        # Modules d'algorithmes instanciés, réutilisés tant que le graphe ne change pas
+        self._modules = {}
         self.init_ui()
         
     def init_ui(self):
@@ -366,8 +368,7 @@ class GraphLabsWindow(QMainWindow):
         if algo_name in self.algorithms:
             module_class = self.algorithms[algo_name]
             if module_class is not None:
-                module = module_class(self.graph, self.canvas)
-                self.algo_description.setText(module.get_description())
+                self.algo_description.setText(module_class.get_description())
             
     def run_algorithm(self):
         """Exécute l'algorithme sélectionné"""
@@ -385,8 +386,11 @@ class GraphLabsWindow(QMainWindow):
         self._reset_graph_colors()
             
         if algo_name in self.algorithms and self.algorithms[algo_name] is not None:
-            module_class = self.algorithms[algo_name]
-            module = module_class(self.graph, self.canvas)
+            module = self._modules.get(algo_name)
+            # Réutiliser le module (et ses tampons) si le graphe n'a pas été remplacé
+            if module is None or module.graph is not self.graph:
+                module_class = self.algorithms[algo_name]
+                module = self._modules[algo_name] = module_class(self.graph, self.canvas)
             
             # Récupérer les valeurs des combos
             start = self.combo_start.currentData()
@@ -426,17 +430,25 @@ class GraphLabsWindow(QMainWindow):
             # Charger le nouveau graphe
             new_graph = graph_func()
             
-            # Remplacer le graphe actuel
-            self.graph.clear()
-            self.graph.nodes = new_graph.nodes
-            self.graph.edges = new_graph.edges
-            self.graph.directed = new_graph.directed
-            self.graph.next_id = new_graph.next_id
-            
-            # Mettre à jour l'interface
-            self.chk_directed.setChecked(self.graph.directed)
-            self.canvas.graph = self.graph
-            self.canvas.clear_highlights()
+            # Aucun repaint ni toggle_directed pendant le remplacement :
+            # un seul update() une fois le graphe complet
+            self.canvas.setUpdatesEnabled(False)
+            old_block = self.chk_directed.blockSignals(True)
+            try:
+                # Remplacer le graphe actuel
+                self.graph.clear()
+                self.graph.nodes = new_graph.nodes
+                self.graph.edges = new_graph.edges
+                self.graph.directed = new_graph.directed
+                self.graph.next_id = new_graph.next_id
+                
+                # Mettre à jour l'interface
+                self.chk_directed.setChecked(self.graph.directed)
+                self.canvas.graph = self.graph
+                self.canvas.clear_highlights()
+            finally:
+                self.chk_directed.blockSignals(old_block)
+                self.canvas.setUpdatesEnabled(True)
             self.canvas.update()
             self.update_node_combos()
             
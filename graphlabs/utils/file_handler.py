@@ -75,6 +75,7 @@ class FileHandler:
             graph.next_id = data.get("next_id", 0)
             
             # Recréer les nœuds
+            nodes = {}
             for node_data in data.get("nodes", []):
                 node = Node(
                     id=node_data["id"],
@@ -83,9 +84,11 @@ class FileHandler:
                     label=node_data["label"],
                     color=node_data.get("color", "#4A90E2")
                 )
-                graph.nodes[node.id] = node
+                nodes[node.id] = node
+            graph.nodes = nodes
             
             # Recréer les arêtes
+            edges = []
             for edge_data in data.get("edges", []):
                 edge = Edge(
                     source=edge_data["source"],
@@ -94,7 +97,8 @@ class FileHandler:
                     directed=edge_data.get("directed", graph.directed),
                     color=edge_data.get("color", "#333333")
                 )
-                graph.edges.append(edge)
+                edges.append(edge)
+            graph.edges = edges
             
             return graph
         except Exception as e:
@@ -3,8 +3,140 @@ Bibliothèque de graphes classiques et d'exemples
 """
 
 import math
+import numpy as np
 from graphlabs.core.graph import Graph
 
+# ==================== DONNÉES DES EXEMPLES ====================
+# Tuples immuables construits une seule fois au chargement du module ;
+# les arêtes sont des tableaux numpy prêts pour Graph.add_edges_batch
+
+def _packed(rows) -> np.ndarray:
+    """Range des arêtes dans un tableau d'entiers en lecture seule"""
+    array = np.array(rows, dtype=np.int64)
+    array.flags.writeable = False
+    return array
+
+# Services du problème des 3 maisons
+_UTILITY_LABELS = ("Eau", "Gaz", "Électricité")
+
+# Les 7 ponts de Königsberg
+_KONIGSBERG_BRIDGES = _packed((
+    (0, 2, 1),  # Nord → Kneiphof (pont 1)
+    (0, 2, 1),  # Nord → Kneiphof (pont 2)
+    (1, 2, 1),  # Sud → Kneiphof (pont 3)
+    (1, 2, 1),  # Sud → Kneiphof (pont 4)
+    (0, 3, 1),  # Nord → Est (pont 5)
+    (1, 3, 1),  # Sud → Est (pont 6)
+    (2, 3, 1),  # Kneiphof → Est (pont 7)
+))
+
+# Graphe pondéré pour Dijkstra
+_DIJKSTRA_EDGES = _packed((
+    (0, 1, 4),  # Départ → B
+    (0, 2, 2),  # Départ → C
+    (1, 3, 3),  # B → D
+    (1, 4, 5),  # B → E
+    (2, 4, 1),  # C → E
+    (2, 5, 8),  # C → F
+    (3, 6, 4),  # D → Arrivée
+    (4, 6, 3),  # E → Arrivée
+    (5, 6, 2),  # F → Arrivée
+))
+
+# Réseau de villes (MST)
+_MST_POSITIONS = (
+    (150, 150, "Ville A"),
+    (350, 100, "Ville B"),
+    (500, 200, "Ville C"),
+    (150, 350, "Ville D"),
+    (350, 400, "Ville E"),
+    (500, 350, "Ville F"),
+)
+
+_MST_EDGES = _packed((
+    (0, 1, 7),   # A-B
+    (0, 3, 5),   # A-D
+    (1, 2, 8),   # B-C
+    (1, 3, 9),   # B-D
+    (1, 4, 7),   # B-E
+    (2, 4, 5),   # C-E
+    (2, 5, 6),   # C-F
+    (3, 4, 15),  # D-E
+    (4, 5, 8),   # E-F
+))
+
+# Étudiants et stages (biparti)
+_STUDENT_LABELS = tuple(f"Étudiant {i + 1}" for i in range(4))
+_STAGE_LABELS = tuple(f"Stage {chr(65 + i)}" for i in range(4))
+
+_BIPARTITE_EDGES = _packed((
+    (0, 4), (0, 5),           # Étudiant 1 → Stage A, B
+    (1, 5), (1, 6),           # Étudiant 2 → Stage B, C
+    (2, 4), (2, 6), (2, 7),   # Étudiant 3 → Stage A, C, D
+    (3, 7),                   # Étudiant 4 → Stage D
+))
+
+# Emploi du temps (coloration)
+_COLORING_COURSES = ("Maths", "Info", "Physique", "Anglais", "Sport", "Histoire", "Chimie")
+
+_COLORING_CONFLICTS = _packed((
+    (0, 1), (0, 2),  # Maths conflits
+    (1, 2), (1, 4),  # Info conflits
+    (2, 6),          # Physique-Chimie
+    (3, 4),          # Anglais-Sport
+    (4, 5),          # Sport-Histoire
+    (5, 6),          # Histoire-Chimie
+    (0, 3),          # Maths-Anglais
+))
+
+# Tâches d'un projet (DAG)
+_DAG_TASKS = (
+    (100, 100, "Cahier charges"),    # 0
+    (250, 50, "Design UI"),          # 1
+    (250, 150, "Base données"),      # 2
+    (400, 100, "Backend"),           # 3
+    (400, 200, "Frontend"),          # 4
+    (550, 150, "Tests"),             # 5
+    (700, 150, "Déploiement"),       # 6
+)
+
+_DAG_DEPENDENCIES = _packed((
+    (0, 1), (0, 2),  # Cahier → Design & BDD
+    (1, 4),          # Design → Frontend
+    (2, 3),          # BDD → Backend
+    (3, 4), (3, 5),  # Backend → Frontend & Tests
+    (4, 5),          # Frontend → Tests
+    (5, 6),          # Tests → Déploiement
+))
+
+# Graphe déconnecté
+_DISCONNECTED_EDGES = _packed((
+    (0, 1, 1), (1, 2, 1), (2, 0, 1),  # Composante 1 : Triangle
+    (3, 4, 1),                        # Composante 2 : Chaîne
+))
+
+# Carré A-B-C-D-A et sa diagonale
+_WITH_CYCLE_EDGES = _packed((
+    (0, 1, 1), (1, 2, 1), (2, 3, 1), (3, 0, 1),  # Cycle : A-B-C-D-A
+    (0, 2, 2),                                   # Diagonale
+))
+
+# Arbre sans cycle
+_TREE_EDGES = _packed((
+    (0, 1), (0, 2),  # A-B, A-C
+    (1, 3), (1, 4),  # B-D, B-E
+    (2, 5), (2, 6),  # C-F, C-G
+))
+
+# Chaîne simple (chemin eulérien)
+_EULERIAN_PATH_POSITIONS = (
+    (100, 250, "A"),   # Degré 1 (impair)
+    (200, 250, "B"),   # Degré 2
+    (300, 250, "C"),   # Degré 2
+    (400, 250, "D"),   # Degré 2
+    (500, 250, "E"),   # Degré 1 (impair)
+)
+
 class GraphLibrary:
     """Collection de graphes prédéfinis pour l'apprentissage"""
     
@@ -25,8 +157,8 @@ class GraphLibrary:
             graph.add_node(x, y)
         
         # Arêtes séquentielles
-        for i in range(n - 1):
-            graph.add_edge(i, i + 1, 1)
+        ids = np.arange(n - 1)
+        graph.add_edges_batch(np.stack([ids, ids + 1], axis=1))
         
         return graph
     
@@ -49,8 +181,8 @@ class GraphLibrary:
             graph.add_node(x, y)
         
         # Arêtes cycliques
-        for i in range(n):
-            graph.add_edge(i, (i + 1) % n, 1)
+        ids = np.arange(n)
+        graph.add_edges_batch(np.stack([ids, (ids + 1) % n], axis=1))
         
         return graph
     
@@ -72,7 +204,10 @@ class GraphLibrary:
             x = 300 + radius * math.cos(angle)
             y = 250 + radius * math.sin(angle)
             graph.add_node(x, y)
-            graph.add_edge(0, i + 1, 1)
+        
+        # Centre relié à chaque branche
+        leaves = np.arange(1, n + 1)
+        graph.add_edges_batch(np.stack([np.zeros_like(leaves), leaves], axis=1))
         
         return graph
     
@@ -94,10 +229,8 @@ class GraphLibrary:
             y = cy + radius * math.sin(angle)
             graph.add_node(x, y)
         
-        # Toutes les arêtes possibles
-        for i in range(n):
-            for j in range(i + 1, n):
-                graph.add_edge(i, j, 1)
+        # Toutes les arêtes possibles (i < j, dans l'ordre lexicographique)
+        graph.add_edges_batch(np.stack(np.triu_indices(n, 1), axis=1))
         
         return graph
     
@@ -108,6 +241,7 @@ class GraphLibrary:
         Utile pour parcours DFS/BFS
         """
         graph = Graph(directed=False)
+        edges = []
         
         # Calculer positions niveau par niveau
         def add_tree_nodes(node_id, level, pos_x, width, max_depth):
@@ -124,18 +258,20 @@ class GraphLibrary:
                 # Fils gauche
                 left_id = add_tree_nodes(node_id + 1, level + 1, 
                                         pos_x - width // 2, width // 2, max_depth)
-                graph.add_edge(current_id, node_id + 1, 1)
+                edges.append((current_id, node_id + 1))
                 
                 # Fils droit
                 right_id = add_tree_nodes(left_id, level + 1, 
                                          pos_x + width // 2, width // 2, max_depth)
-                graph.add_edge(current_id, left_id, 1)
+                edges.append((current_id, left_id))
                 
                 return right_id
             
             return node_id + 1
         
         add_tree_nodes(0, 0, 300, 200, depth)
+        # Arêtes ajoutées une fois tous les sommets créés, dans l'ordre du parcours
+        graph.add_edges_batch(np.array(edges, dtype=np.int64))
         return graph
     
     @staticmethod
@@ -150,29 +286,20 @@ class GraphLibrary:
         offset_x = 150
         offset_y = 150
         
-        # Créer tous les nœuds
-        node_map = {}
-        node_id = 0
+        # Créer tous les nœuds (id = i * cols + j)
         for i in range(rows):
             for j in range(cols):
                 x = offset_x + j * spacing
                 y = offset_y + i * spacing
                 graph.add_node(x, y)
-                node_map[(i, j)] = node_id
-                node_id += 1
         
-        # Arêtes horizontales et verticales
-        for i in range(rows):
-            for j in range(cols):
-                current = node_map[(i, j)]
-                
-                # Droite
-                if j < cols - 1:
-                    graph.add_edge(current, node_map[(i, j + 1)], 1)
-                
-                # Bas
-                if i < rows - 1:
-                    graph.add_edge(current, node_map[(i + 1, j)], 1)
+        ids = np.arange(rows * cols).reshape(rows, cols)
+        
+        # Arêtes horizontales (droite)
+        graph.add_edges_batch(np.stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()], axis=1))
+        
+        # Arêtes verticales (bas)
+        graph.add_edges_batch(np.stack([ids[:-1].ravel(), ids[1:].ravel()], axis=1))
         
         return graph
     
@@ -199,40 +326,35 @@ class GraphLibrary:
         graph.add_node(500, 250, "Île Est")        # D
         
         # Les 7 ponts (arêtes)
-        graph.add_edge(0, 2, 1)  # Nord → Kneiphof (pont 1)
-        graph.add_edge(0, 2, 1)  # Nord → Kneiphof (pont 2)
-        graph.add_edge(1, 2, 1)  # Sud → Kneiphof (pont 3)
-        graph.add_edge(1, 2, 1)  # Sud → Kneiphof (pont 4)
-        graph.add_edge(0, 3, 1)  # Nord → Est (pont 5)
-        graph.add_edge(1, 3, 1)  # Sud → Est (pont 6)
-        graph.add_edge(2, 3, 1)  # Kneiphof → Est (pont 7)
+        graph.add_edges_batch(_KONIGSBERG_BRIDGES)
         
         return graph
     
     @staticmethod
-    def create_utilities() -> Graph:
+    def create_utilities(m: int = 3, n: int = 3) -> Graph:
         """
         Problème des 3 maisons et 3 services (K3,3)
         3 maisons doivent être reliées à 3 services (eau, gaz, électricité)
         sans que les câbles se croisent. Impossible sur un plan !
         Graphe biparti, non planaire
+        
+        Généralisable en Km,n (m maisons, n services)
         """
         graph = Graph(directed=False)
         
-        # 3 maisons (gauche)
-        graph.add_node(100, 100, "Maison 1")
-        graph.add_node(100, 250, "Maison 2")
-        graph.add_node(100, 400, "Maison 3")
+        # m maisons (gauche)
+        for i in range(m):
+            graph.add_node(100, 100 + i * 150, f"Maison {i + 1}")
         
-        # 3 services (droite)
-        graph.add_node(500, 100, "Eau")
-        graph.add_node(500, 250, "Gaz")
-        graph.add_node(500, 400, "Électricité")
+        # n services (droite)
+        for j in range(n):
+            label = _UTILITY_LABELS[j] if j < len(_UTILITY_LABELS) else f"Service {j + 1}"
+            graph.add_node(500, 100 + j * 150, label)
         
         # Toutes les connexions (chaque maison → chaque service)
-        for i in range(3):
-            for j in range(3):
-                graph.add_edge(i, 3 + j, 1)
+        left = np.repeat(np.arange(m), n)
+        right = np.tile(np.arange(m, m + n), m)
+        graph.add_edges_batch(np.stack([left, right], axis=1))
         
         return graph
     
@@ -263,17 +385,16 @@ class GraphLibrary:
             y = cy + radius_inner * math.sin(angle)
             graph.add_node(x, y)
         
+        ids = np.arange(5)
+        
         # Arêtes du pentagone extérieur
-        for i in range(5):
-            graph.add_edge(i, (i + 1) % 5, 1)
+        graph.add_edges_batch(np.stack([ids, (ids + 1) % 5], axis=1))
         
         # Arêtes de l'étoile intérieure
-        for i in range(5):
-            graph.add_edge(5 + i, 5 + ((i + 2) % 5), 1)
+        graph.add_edges_batch(np.stack([5 + ids, 5 + (ids + 2) % 5], axis=1))
         
         # Arêtes radiales
-        for i in range(5):
-            graph.add_edge(i, 5 + i, 1)
+        graph.add_edges_batch(np.stack([ids, 5 + ids], axis=1))
         
         return graph
     
@@ -297,15 +418,7 @@ class GraphLibrary:
         graph.add_node(550, 250, "Arrivée")  # 6
         
         # Arêtes avec poids variés
-        graph.add_edge(0, 1, 4)   # Départ → B
-        graph.add_edge(0, 2, 2)   # Départ → C
-        graph.add_edge(1, 3, 3)   # B → D
-        graph.add_edge(1, 4, 5)   # B → E
-        graph.add_edge(2, 4, 1)   # C → E
-        graph.add_edge(2, 5, 8)   # C → F
-        graph.add_edge(3, 6, 4)   # D → Arrivée
-        graph.add_edge(4, 6, 3)   # E → Arrivée
-        graph.add_edge(5, 6, 2)   # F → Arrivée
+        graph.add_edges_batch(_DIJKSTRA_EDGES)
         
         return graph
     
@@ -318,33 +431,11 @@ class GraphLibrary:
         graph = Graph(directed=False)
         
         # 6 villes
-        positions = [
-            (150, 150, "Ville A"),
-            (350, 100, "Ville B"),
-            (500, 200, "Ville C"),
-            (150, 350, "Ville D"),
-            (350, 400, "Ville E"),
-            (500, 350, "Ville F")
-        ]
-        
-        for x, y, label in positions:
+        for x, y, label in _MST_POSITIONS:
             graph.add_node(x, y, label)
         
         # Connexions avec coûts
-        edges = [
-            (0, 1, 7),   # A-B
-            (0, 3, 5),   # A-D
-            (1, 2, 8),   # B-C
-            (1, 3, 9),   # B-D
-            (1, 4, 7),   # B-E
-            (2, 4, 5),   # C-E
-            (2, 5, 6),   # C-F
-            (3, 4, 15),  # D-E
-            (4, 5, 8),   # E-F
-        ]
-        
-        for src, tgt, weight in edges:
-            graph.add_edge(src, tgt, weight)
+        graph.add_edges_batch(_MST_EDGES)
         
         return graph
     
@@ -357,23 +448,15 @@ class GraphLibrary:
         graph = Graph(directed=False)
         
         # 4 étudiants (gauche)
-        for i in range(4):
-            graph.add_node(100, 100 + i * 80, f"Étudiant {i+1}")
+        for i, label in enumerate(_STUDENT_LABELS):
+            graph.add_node(100, 100 + i * 80, label)
         
         # 4 stages (droite)
-        for i in range(4):
-            graph.add_node(400, 100 + i * 80, f"Stage {chr(65+i)}")
+        for i, label in enumerate(_STAGE_LABELS):
+            graph.add_node(400, 100 + i * 80, label)
         
         # Connexions (préférences)
-        edges = [
-            (0, 4), (0, 5),           # Étudiant 1 → Stage A, B
-            (1, 5), (1, 6),           # Étudiant 2 → Stage B, C
-            (2, 4), (2, 6), (2, 7),   # Étudiant 3 → Stage A, C, D
-            (3, 7),                   # Étudiant 4 → Stage D
-        ]
-        
-        for src, tgt in edges:
-            graph.add_edge(src, tgt, 1)
+        graph.add_edges_batch(_BIPARTITE_EDGES)
         
         return graph
     
@@ -386,29 +469,17 @@ class GraphLibrary:
         graph = Graph(directed=False)
         
         # 7 cours en cercle
-        courses = ["Maths", "Info", "Physique", "Anglais", "Sport", "Histoire", "Chimie"]
         radius = 150
         cx, cy = 300, 250
         
-        for i, course in enumerate(courses):
-            angle = 2 * math.pi * i / len(courses) - math.pi / 2
+        for i, course in enumerate(_COLORING_COURSES):
+            angle = 2 * math.pi * i / len(_COLORING_COURSES) - math.pi / 2
             x = cx + radius * math.cos(angle)
             y = cy + radius * math.sin(angle)
             graph.add_node(x, y, course)
         
         # Conflits (même prof, même salle, etc.)
-        conflicts = [
-            (0, 1), (0, 2),  # Maths conflits
-            (1, 2), (1, 4),  # Info conflits
-            (2, 6),          # Physique-Chimie
-            (3, 4),          # Anglais-Sport
-            (4, 5),          # Sport-Histoire
-            (5, 6),          # Histoire-Chimie
-            (0, 3),          # Maths-Anglais
-        ]
-        
-        for src, tgt in conflicts:
-            graph.add_edge(src, tgt, 1)
+        graph.add_edges_batch(_COLORING_CONFLICTS)
         
         return graph
     
@@ -421,31 +492,11 @@ class GraphLibrary:
         graph = Graph(directed=True)
         
         # Tâches d'un projet
-        tasks = [
-            (100, 100, "Cahier charges"),    # 0
-            (250, 50, "Design UI"),          # 1
-            (250, 150, "Base données"),      # 2
-            (400, 100, "Backend"),           # 3
-            (400, 200, "Frontend"),          # 4
-            (550, 150, "Tests"),             # 5
-            (700, 150, "Déploiement")        # 6
-        ]
-        
-        for x, y, label in tasks:
+        for x, y, label in _DAG_TASKS:
             graph.add_node(x, y, label)
         
         # Dépendances (orientées)
-        dependencies = [
-            (0, 1), (0, 2),  # Cahier → Design & BDD
-            (1, 4),          # Design → Frontend
-            (2, 3),          # BDD → Backend
-            (3, 4), (3, 5),  # Backend → Frontend & Tests
-            (4, 5),          # Frontend → Tests
-            (5, 6),          # Tests → Déploiement
-        ]
-        
-        for src, tgt in dependencies:
-            graph.add_edge(src, tgt, 1)
+        graph.add_edges_batch(_DAG_DEPENDENCIES)
         
         return graph
     
@@ -501,18 +552,16 @@ class GraphLibrary:
         graph.add_node(100, 150, "A")
         graph.add_node(200, 100, "B")
         graph.add_node(200, 200, "C")
-        graph.add_edge(0, 1, 1)
-        graph.add_edge(1, 2, 1)
-        graph.add_edge(2, 0, 1)
         
         # Composante 2 : Chaîne
         graph.add_node(350, 150, "D")
         graph.add_node(450, 150, "E")
-        graph.add_edge(3, 4, 1)
         
         # Composante 3 : Sommet isolé
         graph.add_node(300, 300, "F")
         
+        graph.add_edges_batch(_DISCONNECTED_EDGES)
+        
         return graph
     
     @staticmethod
@@ -529,14 +578,8 @@ class GraphLibrary:
         graph.add_node(350, 350, "C")
         graph.add_node(150, 350, "D")
         
-        # Cycle : A-B-C-D-A
-        graph.add_edge(0, 1, 1)
-        graph.add_edge(1, 2, 1)
-        graph.add_edge(2, 3, 1)
-        graph.add_edge(3, 0, 1)
-        
-        # Une arête supplémentaire
-        graph.add_edge(0, 2, 2)  # Diagonale
+        # Cycle A-B-C-D-A et une diagonale
+        graph.add_edges_batch(_WITH_CYCLE_EDGES)
         
         return graph
     
@@ -557,12 +600,7 @@ class GraphLibrary:
         graph.add_node(300, 300, "F")
         graph.add_node(400, 300, "G")
         
-        graph.add_edge(0, 1, 1)  # A-B
-        graph.add_edge(0, 2, 1)  # A-C
-        graph.add_edge(1, 3, 1)  # B-D
-        graph.add_edge(1, 4, 1)  # B-E
-        graph.add_node(2, 5, 1)  # C-F
-        graph.add_edge(2, 6, 1)  # C-G
+        graph.add_edges_batch(_TREE_EDGES)
         
         return graph
     
@@ -586,8 +624,8 @@ class GraphLibrary:
             graph.add_node(x, y)
         
         # Cycle
-        for i in range(n):
-            graph.add_edge(i, (i + 1) % n, 1)
+        ids = np.arange(n)
+        graph.add_edges_batch(np.stack([ids, (ids + 1) % n], axis=1))
         
         return graph
     
@@ -600,18 +638,10 @@ class GraphLibrary:
         graph = Graph(directed=False)
         
         # Chaîne simple (extrémités = degré 1 impair)
-        positions = [
-            (100, 250, "A"),   # Degré 1 (impair)
-            (200, 250, "B"),   # Degré 2
-            (300, 250, "C"),   # Degré 2
-            (400, 250, "D"),   # Degré 2
-            (500, 250, "E"),   # Degré 1 (impair)
-        ]
-        
-        for i, (x, y, label) in enumerate(positions):
+        for x, y, label in _EULERIAN_PATH_POSITIONS:
             graph.add_node(x, y, label)
         
-        for i in range(4):
-            graph.add_edge(i, i + 1, 1)
+        ids = np.arange(len(_EULERIAN_PATH_POSITIONS) - 1)
+        graph.add_edges_batch(np.stack([ids, ids + 1], axis=1))
         
         return graph
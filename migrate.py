@@ -5,47 +5,90 @@ Réorganise le code monolithique en architecture modulaire
 """
 
 import os
-import shutil
-from pathlib import Path
+import sys
 
 # Code source à diviser
 GRAPH_CORE = '''"""
 Structures de données de base pour les graphes
 """
 
-from dataclasses import dataclass
 from typing import List, Dict, Set, Tuple, Optional
 
-@dataclass
 class Node:
     """Représente un sommet du graphe"""
-    id: int
-    x: float
-    y: float
-    label: str = ""
-    color: str = "#4A90E2"
+    # Attributs fixes : pas de __dict__ par instance (dataclass(slots=True) exige Python 3.10).
+    # Pas figé (frozen) : le graphe modifie ses sommets en place (position,
+    # label, couleur, id renuméroté) et les repère par id, pas par hachage.
+    __slots__ = ("id", "x", "y", "label", "color")
+    
+    def __init__(self, id: int, x: float, y: float, label: str = "", color: str = "#4A90E2"):
+        self.id = id
+        self.x = x
+        self.y = y
+        self.label = label
+        self.color = color
+    
+    def __repr__(self):
+        return (f"Node(id={self.id!r}, x={self.x!r}, y={self.y!r}, "
+                f"label={self.label!r}, color={self.color!r})")
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.id, self.x, self.y, self.label, self.color) ==
+                (other.id, other.x, other.y, other.label, other.color))
     
-@dataclass
 class Edge:
     """Représente une arête du graphe"""
-    source: int
-    target: int
-    weight: float = 1.0
-    directed: bool = False
-    color: str = "#333333"
+    # Même choix que Node : slots sans gel, le poids et la couleur changent en place
+    __slots__ = ("source", "target", "weight", "directed", "color")
+    
+    def __init__(self, source: int, target: int, weight: float = 1.0,
+                 directed: bool = False, color: str = "#333333"):
+        self.source = source
+        self.target = target
+        self.weight = weight
+        self.directed = directed
+        self.color = color
+    
+    def __repr__(self):
+        return (f"Edge(source={self.source!r}, target={self.target!r}, weight={self.weight!r}, "
+                f"directed={self.directed!r}, color={self.color!r})")
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.source, self.target, self.weight, self.directed, self.color) ==
+                (other.source, other.target, other.weight, other.directed, other.color))
 
 class Graph:
     """Modèle de graphe avec opérations de base"""
     def __init__(self, directed=False):
         self.nodes: Dict[int, Node] = {}
         self.edges: List[Edge] = []
-        self.directed = directed
+        self._directed = directed
         self.next_id = 0
+        # Listes d'adjacence tenues à jour par add_node/add_edge,
+        # reconstruites à la demande après une suppression
+        self._adj: Dict[int, List[int]] = {}
+        self._adj_dirty = False
+        
+    @property
+    def directed(self) -> bool:
+        """Graphe orienté ou non (le changer invalide l'index d'adjacence)"""
+        return self._directed
+    
+    @directed.setter
+    def directed(self, value: bool):
+        """Change l'orientation et marque l'index d'adjacence comme obsolète"""
+        self._directed = value
+        self._adj_dirty = True
         
     def add_node(self, x: float, y: float, label: str = "") -> int:
         """Ajoute un sommet au graphe"""
         node_id = self.next_id
         self.nodes[node_id] = Node(node_id, x, y, label or str(node_id))
+        self._adj[node_id] = []
         self.next_id += 1
         return node_id
         
@@ -53,26 +96,37 @@ class Graph:
         """Ajoute une arête entre deux sommets"""
         if source in self.nodes and target in self.nodes:
             self.edges.append(Edge(source, target, weight, self.directed))
+            if not self._adj_dirty:
+                self._adj[source].append(target)
+                if not self.directed:
+                    self._adj[target].append(source)
             
     def remove_node(self, node_id: int):
         """Supprime un sommet et toutes ses arêtes"""
         if node_id in self.nodes:
             del self.nodes[node_id]
             self.edges = [e for e in self.edges if e.source != node_id and e.target != node_id]
+            self._adj_dirty = True
             
     def remove_edge(self, source: int, target: int):
         """Supprime une arête"""
         self.edges = [e for e in self.edges if not (e.source == source and e.target == target)]
+        self._adj_dirty = True
         
-    def get_neighbors(self, node_id: int) -> List[int]:
-        """Retourne la liste des voisins d'un sommet"""
-        neighbors = []
+    def _rebuild_adj(self):
+        """Reconstruit les listes d'adjacence à partir des arêtes"""
+        self._adj = {node_id: [] for node_id in self.nodes}
         for edge in self.edges:
-            if edge.source == node_id:
-                neighbors.append(edge.target)
-            elif not self.directed and edge.target == node_id:
-                neighbors.append(edge.source)
-        return neighbors
+            self._adj[edge.source].append(edge.target)
+            if not self.directed:
+                self._adj[edge.target].append(edge.source)
+        self._adj_dirty = False
+        
+    def get_neighbors(self, node_id: int) -> Tuple[int, ...]:
+        """Retourne les voisins d'un sommet (tuple non modifiable)"""
+        if self._adj_dirty:
+            self._rebuild_adj()
+        return tuple(self._adj.get(node_id, ()))
         
     def get_adjacency_matrix(self) -> List[List[float]]:
         """Retourne la matrice d'adjacence"""
@@ -90,6 +144,8 @@ class Graph:
         """Efface tout le graphe"""
         self.nodes.clear()
         self.edges.clear()
+        self._adj.clear()
+        self._adj_dirty = False
         self.next_id = 0
 '''
 
@@ -142,7 +198,8 @@ class AlgorithmModule:
         """
         raise NotImplementedError
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """
         Retourne une description pédagogique de l'algorithme
         
@@ -202,7 +259,8 @@ class DFSModule(AlgorithmModule):
                 f"Ordre de visite: {' → '.join(map(str, order))}\\n"
                 f"Sommets visités: {len(visited)}/{len(self.graph.nodes)}")
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Parcours en Profondeur (DFS):\\n\\n"
                 "Explore un graphe en allant le plus loin possible sur chaque branche "
                 "avant de revenir en arrière. Utilise une pile (ou la récursion).\\n\\n"
@@ -255,7 +313,8 @@ class BFSModule(AlgorithmModule):
                 f"Ordre de visite: {' → '.join(map(str, order))}\\n"
                 f"Sommets visités: {len(visited)}/{len(self.graph.nodes)}")
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Parcours en Largeur (BFS):\\n\\n"
                 "Explore un graphe niveau par niveau, visitant tous les voisins "
                 "directs avant de passer aux voisins des voisins. Utilise une file.\\n\\n"
@@ -336,7 +395,8 @@ class DijkstraModule(AlgorithmModule):
             result += f"  Sommet {node}: {dist_str}\\n"
         return result.strip()
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return ("Algorithme de Dijkstra:\\n\\n"
                 "Trouve le plus court chemin dans un graphe pondéré avec poids positifs. "
                 "Utilise une file de priorité pour explorer les sommets par ordre de distance croissante.\\n\\n"
@@ -758,8 +818,7 @@ class GraphLabsWindow(QMainWindow):
         algo_name = self.algo_combo.currentText()
         if algo_name in self.algorithms:
             module_class = self.algorithms[algo_name]
-            module = module_class(self.graph, self.canvas)
-            self.algo_description.setText(module.get_description())
+            self.algo_description.setText(module_class.get_description())
             
     def run_algorithm(self):
         """Exécute l'algorithme sélectionné"""
@@ -826,14 +885,19 @@ MAIN_PY = '''"""
 Point d'entrée principal de GraphLabs
 """
 
+import os
 import sys
-from PyQt6.QtWidgets import QApplication
-from graphlabs.ui.main_window import GraphLabsWindow
 
 def main():
     """Lance l'application GraphLabs"""
+    # Imports différés : importer graphlabs.main ne charge ni Qt ni numpy
+    from PyQt6.QtWidgets import QApplication
+    from graphlabs.ui.main_window import GraphLabsWindow
+    
+    # Style choisi à la construction de QApplication plutôt qu'appliqué après
+    # (QT_STYLE_OVERRIDE déjà défini par l'utilisateur reste prioritaire)
+    os.environ.setdefault("QT_STYLE_OVERRIDE", "Fusion")
     app = QApplication(sys.argv)
-    app.setStyle('Fusion')
     window = GraphLabsWindow()
     window.show()
     sys.exit(app.exec())
@@ -850,25 +914,60 @@ black>=23.0.0
 flake8>=6.0.0
 '''
 
-SETUP_PY = '''from setuptools import setup, find_packages
-
-setup(
-    name="graphlabs",
-    version="1.0.0",
-    description="Application didactique de théorie des graphes",
-    packages=find_packages(),
-    install_requires=[
-        "PyQt6>=6.7.0",
-        "numpy>=1.24.0",
-    ],
-    entry_points={
-        "console_scripts": [
-            "graphlabs=graphlabs.main:main",
-        ],
-    },
-    python_requires=">=3.9",
-)
-'''
+# Structure des dossiers
+_DIRECTORIES = [
+    "graphlabs/core",
+    "graphlabs/ui/widgets",
+    "graphlabs/algorithms/traversal",
+    "graphlabs/algorithms/shortest_path",
+    "graphlabs/algorithms/connectivity",
+    "graphlabs/algorithms/trees",
+    "graphlabs/algorithms/cycles",
+    "graphlabs/algorithms/flow",
+    "graphlabs/algorithms/coloring",
+    "graphlabs/algorithms/centrality",
+    "graphlabs/algorithms/np_problems",
+    "graphlabs/utils",
+    "graphlabs/resources/styles",
+    "graphlabs/resources/icons",
+    "graphlabs/resources/examples",
+    "tests/test_algorithms",
+    "tests/test_ui",
+    "docs",
+    "scripts",
+]
+
+# Packages installés, connus d'avance : pas de recherche dans l'arborescence
+# à la construction. Les dossiers de ressources et les tests n'en font pas partie.
+_PACKAGES = sorted({
+    ".".join(parts[:depth])
+    for parts in (d.split("/") for d in _DIRECTORIES
+                  if d.startswith("graphlabs/")
+                  and not d.endswith(("styles", "icons", "examples")))
+    for depth in range(1, len(parts) + 1)
+})
+
+PYPROJECT_TOML = '''[build-system]
+requires = ["setuptools>=61"]
+build-backend = "setuptools.build_meta"
+
+[project]
+name = "graphlabs"
+version = "1.0.0"
+description = "Application didactique de théorie des graphes"
+requires-python = ">=3.9"
+dependencies = [
+    "PyQt6>=6.7.0",
+    "numpy>=1.24.0",
+]
+
+[project.scripts]
+graphlabs = "graphlabs.main:main"
+
+[tool.setuptools]
+packages = [
+%s]
+''' % "".join(f'    "{package}",\n' for package in _PACKAGES)
 
 README = '''# 🎓 GraphLabs
 
@@ -965,86 +1064,97 @@ dist/
 Thumbs.db
 '''
 
+# Contenu final de chaque fichier migré, encodé une fois pour toutes
+_FILES = {path: (content.strip() + "\n").encode("utf-8") for path, content in [
+    # Fichiers core
+    ("graphlabs/core/graph.py", GRAPH_CORE),
+    ("graphlabs/core/constants.py", CONSTANTS),
+    # Fichiers algorithms
+    ("graphlabs/algorithms/base.py", ALGORITHM_BASE),
+    ("graphlabs/algorithms/traversal/dfs.py", DFS_MODULE),
+    ("graphlabs/algorithms/traversal/bfs.py", BFS_MODULE),
+    ("graphlabs/algorithms/shortest_path/dijkstra.py", DIJKSTRA_MODULE),
+    # Fichiers UI
+    ("graphlabs/ui/canvas.py", CANVAS),
+    ("graphlabs/ui/main_window.py", MAIN_WINDOW),
+    # Main
+    ("graphlabs/main.py", MAIN_PY),
+    # Configuration
+    ("requirements.txt", REQUIREMENTS),
+    ("pyproject.toml", PYPROJECT_TOML),
+    ("README.md", README),
+    (".gitignore", GITIGNORE),
+]}
+
+# Dossiers déjà créés pendant cette exécution (voir _makedirs)
+_created_dirs = set()
+
 def create_directory_structure():
     """Crée l'arborescence complète du projet"""
     
-    base_dir = Path("graphlabs")
-    
-    # Structure des dossiers
-    directories = [
-        "graphlabs/core",
-        "graphlabs/ui/widgets",
-        "graphlabs/algorithms/traversal",
-        "graphlabs/algorithms/shortest_path",
-        "graphlabs/algorithms/connectivity",
-        "graphlabs/algorithms/trees",
-        "graphlabs/algorithms/cycles",
-        "graphlabs/algorithms/flow",
-        "graphlabs/algorithms/coloring",
-        "graphlabs/algorithms/centrality",
-        "graphlabs/algorithms/np_problems",
-        "graphlabs/utils",
-        "graphlabs/resources/styles",
-        "graphlabs/resources/icons",
-        "graphlabs/resources/examples",
-        "tests/test_algorithms",
-        "tests/test_ui",
-        "docs",
-        "scripts",
+    # Contenu des __init__.py des packages Python, préparé d'avance
+    init_files = [
+        (os.path.join(directory, "__init__.py"),
+         f'"""Module {directory.replace("/", ".")}"""\n'.encode("utf-8"))
+        for directory in _DIRECTORIES
+        if directory.startswith(("graphlabs", "tests"))
     ]
     
     print("🏗️  Création de la structure de dossiers...")
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        # Créer __init__.py dans les packages Python
-        if directory.startswith("graphlabs") or directory.startswith("tests"):
-            init_file = Path(directory) / "__init__.py"
-            if not init_file.exists():
-                init_file.write_text('"""Module {}"""\n'.format(directory.replace("/", ".")))
+    for directory in _DIRECTORIES:
+        _makedirs(directory)
+    
+    # O_EXCL : un __init__.py existant est conservé, sans stat préalable
+    for path, blob in init_files:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        try:
+            os.write(fd, blob)
+        finally:
+            os.close(fd)
     
     print("✅ Structure créée!")
 
+def _makedirs(directory: str):
+    """Crée directory et ses parents, une seule fois par exécution"""
+    if directory in _created_dirs:
+        return
+    os.makedirs(directory, exist_ok=True)
+    # Les parents existent aussi : write_file n'a plus à les recréer
+    while directory and directory not in _created_dirs:
+        _created_dirs.add(directory)
+        directory = os.path.dirname(directory)
+
+def _write_bytes(path: str, blob: bytes):
+    """Écrit un fichier dont le contenu est déjà encodé"""
+    parent = os.path.dirname(path)
+    if parent:
+        _makedirs(parent)
+    # Écriture binaire : ni couche texte ni traduction des fins de ligne
+    with open(path, "wb") as f:
+        f.write(blob)
+    print(f"  📝 {path}")
+
 def write_file(path: str, content: str):
     """Écrit un fichier avec le contenu donné"""
-    file_path = Path(path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(content.strip() + "\n")
-    print(f"  📝 {path}")
+    _write_bytes(path, (content.strip() + "\n").encode("utf-8"))
 
 def migrate_code():
     """Migre le code vers la nouvelle structure"""
     
-    print("\\n📦 Migration du code...")
-    
-    # Fichiers core
-    write_file("graphlabs/core/graph.py", GRAPH_CORE)
-    write_file("graphlabs/core/constants.py", CONSTANTS)
+    print("\n📦 Migration du code...")
     
-    # Fichiers algorithms
-    write_file("graphlabs/algorithms/base.py", ALGORITHM_BASE)
-    write_file("graphlabs/algorithms/traversal/dfs.py", DFS_MODULE)
-    write_file("graphlabs/algorithms/traversal/bfs.py", BFS_MODULE)
-    write_file("graphlabs/algorithms/shortest_path/dijkstra.py", DIJKSTRA_MODULE)
-    
-    # Fichiers UI
-    write_file("graphlabs/ui/canvas.py", CANVAS)
-    write_file("graphlabs/ui/main_window.py", MAIN_WINDOW)
-    
-    # Main
-    write_file("graphlabs/main.py", MAIN_PY)
-    
-    # Configuration
-    write_file("requirements.txt", REQUIREMENTS)
-    write_file("setup.py", SETUP_PY)
-    write_file("README.md", README)
-    write_file(".gitignore", GITIGNORE)
+    for path, blob in _FILES.items():
+        _write_bytes(path, blob)
     
     print("✅ Migration terminée!")
 
 def create_template_files():
     """Crée des fichiers templates pour les futurs algorithmes"""
     
-    print("\\n📄 Création de fichiers templates...")
+    print("\n📄 Création de fichiers templates...")
     
     # Template pour nouveaux algorithmes
     algo_template = '''"""
@@ -1060,7 +1170,8 @@ class TemplateModule(AlgorithmModule):
         # TODO: Implémenter
         return "Non implémenté"
         
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         return "Description TODO"
     
     def get_complexity(self) -> str:
@@ -1083,13 +1194,24 @@ class TemplateModule(AlgorithmModule):
 def create_test_files():
     """Crée des fichiers de tests basiques"""
     
-    print("\\n🧪 Création de tests...")
+    print("\n🧪 Création de tests...")
     
     test_graph = '''"""Tests pour la classe Graph"""
 
 import pytest
 from graphlabs.core.graph import Graph, Node, Edge
 
+@pytest.fixture
+def star_graph():
+    """Trois sommets, le premier relié aux deux autres"""
+    g = Graph()
+    n1 = g.add_node(0, 0)
+    n2 = g.add_node(100, 100)
+    n3 = g.add_node(200, 200)
+    g.add_edge(n1, n2)
+    g.add_edge(n1, n3)
+    return g, n1, n2, n3
+
 def test_add_node():
     g = Graph()
     node_id = g.add_node(100, 200, "A")
@@ -1105,13 +1227,8 @@ def test_add_edge():
     assert len(g.edges) == 1
     assert g.edges[0].weight == 5.0
 
-def test_get_neighbors():
-    g = Graph()
-    n1 = g.add_node(0, 0)
-    n2 = g.add_node(100, 100)
-    n3 = g.add_node(200, 200)
-    g.add_edge(n1, n2)
-    g.add_edge(n1, n3)
+def test_get_neighbors(star_graph):
+    g, n1, n2, n3 = star_graph
     neighbors = g.get_neighbors(n1)
     assert len(neighbors) == 2
     assert n2 in neighbors
@@ -1122,6 +1239,37 @@ def test_get_neighbors():
     
     print("✅ Tests créés!")
 
+# Récapitulatif affiché en fin de migration, écrit en une seule fois
+_EPILOGUE = "\n".join([
+    "",
+    "=" * 60,
+    "✨ MIGRATION RÉUSSIE!",
+    "=" * 60,
+    "",
+    "📋 Prochaines étapes:",
+    "",
+    "1. Créer l'environnement virtuel:",
+    "   python -m venv venv",
+    "   source venv/bin/activate  # Linux/Mac",
+    "   venv\\Scripts\\activate    # Windows",
+    "",
+    "2. Installer les dépendances:",
+    "   pip install -r requirements.txt",
+    "",
+    "3. Installer en mode dev:",
+    "   pip install -e .",
+    "",
+    "4. Lancer l'application:",
+    "   python -m graphlabs.main",
+    "   # ou",
+    "   graphlabs",
+    "",
+    "5. Lancer les tests:",
+    "   pytest",
+    "",
+    "=" * 60,
+]) + "\n"
+
 def main():
     """Fonction principale de migration"""
     
@@ -1130,13 +1278,24 @@ def main():
     print("=" * 60)
     
     # Vérifier si le dossier existe déjà
-    if Path("graphlabs").exists():
-        response = input("\\n⚠️  Le dossier 'graphlabs' existe déjà. Continuer? (o/N): ")
+    cleaner = None
+    if os.path.exists("graphlabs"):
+        response = input("\n⚠️  Le dossier 'graphlabs' existe déjà. Continuer? (o/N): ")
         if response.lower() != 'o':
             print("❌ Migration annulée")
             return
         print("🗑️  Suppression de l'ancien dossier...")
-        shutil.rmtree("graphlabs")
+        # Importés seulement ici : inutiles quand il n'y a rien à supprimer
+        import shutil
+        import threading
+        import time
+        
+        # Renommer est immédiat ; la suppression se fait pendant la migration
+        backup = f"graphlabs.old-{int(time.time())}"
+        os.rename("graphlabs", backup)
+        cleaner = threading.Thread(target=shutil.rmtree, args=(backup,),
+                                   kwargs={"ignore_errors": True})
+        cleaner.start()
     
     # Étapes de migration
     create_directory_structure()
@@ -1144,25 +1303,11 @@ def main():
     create_template_files()
     create_test_files()
     
-    print("\\n" + "=" * 60)
-    print("✨ MIGRATION RÉUSSIE!")
-    print("=" * 60)
-    print("\\n📋 Prochaines étapes:\\n")
-    print("1. Créer l'environnement virtuel:")
-    print("   python -m venv venv")
-    print("   source venv/bin/activate  # Linux/Mac")
-    print("   venv\\\\Scripts\\\\activate    # Windows")
-    print("\\n2. Installer les dépendances:")
-    print("   pip install -r requirements.txt")
-    print("\\n3. Installer en mode dev:")
-    print("   pip install -e .")
-    print("\\n4. Lancer l'application:")
-    print("   python -m graphlabs.main")
-    print("   # ou")
-    print("   graphlabs")
-    print("\\n5. Lancer les tests:")
-    print("   pytest")
-    print("\\n" + "=" * 60)
+    if cleaner is not None:
+        cleaner.join()
+    
+    sys.stdout.write(_EPILOGUE)
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,13 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup
 
+# Les métadonnées sont dans pyproject.toml ; ce fichier ne déclare que
+# l'extension C de Dijkstra, ignorée si la compilation échoue
 setup(
-    name="graphlabs",
-    version="1.0.0",
-    description="Application didactique de théorie des graphes",
-    packages=find_packages(),
-    install_requires=[
-        "PyQt6>=6.7.0",
-        "numpy>=1.24.0",
+    ext_modules=[
+        Extension(
+            "graphlabs.algorithms._cdijkstra",
+            sources=["graphlabs/algorithms/_cdijkstra.c"],
+            optional=True,
+        ),
     ],
-    entry_points={
-        "console_scripts": [
-            "graphlabs=graphlabs.main:main",
-        ],
-    },
-    python_requires=">=3.9",
 )
@@ -0,0 +1,24 @@
+"""Configuration commune des tests"""
+
+import pytest
+from graphlabs.algorithms.kernels import warmup
+
+@pytest.fixture(scope="session", autouse=True)
+def compiled_kernels():
+    """Compile les noyaux Numba une seule fois, avant le premier test"""
+    warmup()
+
+@pytest.fixture(params=["numba", "scipy", "python"])
+def traversal_backend(request, monkeypatch):
+    """Force la branche Numba, SciPy ou Python pur des parcours BFS/DFS"""
+    from graphlabs.algorithms.kernels import HAS_SCIPY
+    from graphlabs.algorithms.traversal import bfs, dfs
+    
+    backend = request.param
+    # Sans Numba, la branche "numba" exécute les noyaux CSR en Python pur
+    if backend == "scipy" and not HAS_SCIPY:
+        pytest.skip("SciPy non installé")
+    for module in (bfs, dfs):
+        monkeypatch.setattr(module, "HAS_NUMBA", backend == "numba")
+        monkeypatch.setattr(module, "HAS_SCIPY", backend == "scipy")
+    return backend
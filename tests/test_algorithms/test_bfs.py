@@ -0,0 +1,18 @@
+"""Tests pour le parcours en largeur"""
+
+from unittest.mock import Mock
+from graphlabs.core.graph import Graph
+from graphlabs.algorithms.traversal.bfs import BFSModule
+
+def test_bfs_order_same_for_all_backends(traversal_backend):
+    """Numba, SciPy et Python pur suivent l'ordre de get_neighbors (non trié par id)."""
+    graph = Graph()
+    a, b, c, d, e = (graph.add_node(i * 100, 0, label) for i, label in enumerate("ABCDE"))
+    graph.add_edge(a, c)
+    graph.add_edge(a, b)
+    graph.add_edge(b, d)
+    graph.add_edge(c, e)
+    
+    result = BFSModule(graph, Mock()).run(start_node=a)
+    
+    assert "A → C → B → E → D" in result
@@ -0,0 +1,88 @@
+"""Tests pour le parcours en profondeur"""
+
+from unittest.mock import Mock
+from graphlabs.core.graph import Graph
+from graphlabs.algorithms.traversal import dfs
+from graphlabs.algorithms.traversal.dfs import DFSModule
+from graphlabs.utils.graph_library import GraphLibrary
+
+def test_dfs_order():
+    """Les voisins sont visités dans l'ordre de la version récursive."""
+    graph = Graph()
+    a = graph.add_node(0, 0, "A")
+    b = graph.add_node(100, 0, "B")
+    c = graph.add_node(200, 0, "C")
+    d = graph.add_node(300, 0, "D")
+    
+    graph.add_edge(a, b)
+    graph.add_edge(a, c)
+    graph.add_edge(b, d)
+    
+    result = DFSModule(graph, Mock()).run(start_node=a)
+    
+    assert "A → B → D → C" in result
+
+def test_dfs_order_same_for_all_backends(traversal_backend):
+    """Numba, SciPy et Python pur suivent l'ordre de get_neighbors (non trié par id)."""
+    graph = Graph()
+    a, b, c, d, e = (graph.add_node(i * 100, 0, label) for i, label in enumerate("ABCDE"))
+    graph.add_edge(a, c)
+    graph.add_edge(a, b)
+    graph.add_edge(b, d)
+    graph.add_edge(c, e)
+    
+    result = DFSModule(graph, Mock()).run(start_node=a)
+    
+    assert "A → C → E → B → D" in result
+
+def test_dfs_python_fallback_backtracking(monkeypatch):
+    """La pile d'itérateurs reprend chaque sommet là où la récursion l'aurait repris."""
+    monkeypatch.setattr(dfs, "HAS_NUMBA", False)
+    monkeypatch.setattr(dfs, "HAS_SCIPY", False)
+    graph = Graph()
+    a, b, c, d, e, f, g = (graph.add_node(i * 100, 0, label) for i, label in enumerate("ABCDEFG"))
+    graph.add_edge(a, b)
+    graph.add_edge(a, c)
+    graph.add_edge(b, d)
+    graph.add_edge(b, e)
+    graph.add_edge(d, f)
+    graph.add_edge(e, a)
+    graph.add_edge(c, g)
+    
+    result = DFSModule(graph, Mock()).run(start_node=a)
+    
+    def recursive(node, visited):
+        visited.append(node)
+        for neighbor in graph.get_neighbors(node):
+            if neighbor not in visited:
+                recursive(neighbor, visited)
+        return visited
+    
+    assert recursive(a, []) == [a, b, d, f, e, c, g]
+    assert "A → B → D → F → E → C → G" in result
+
+def test_dfs_long_chain():
+    """Pas de RecursionError sur une longue chaîne."""
+    graph = GraphLibrary.create_chain(5000)
+    
+    result = DFSModule(graph, Mock()).run(start_node=0)
+    
+    assert "Sommets visités : 5000 / 5000" in result
+
+def test_dfs_rerun(monkeypatch):
+    """Les marques de visite sont remises à zéro entre deux exécutions."""
+    monkeypatch.setattr(dfs, "HAS_NUMBA", False)
+    monkeypatch.setattr(dfs, "HAS_SCIPY", False)
+    graph = GraphLibrary.create_chain(10)
+    module = DFSModule(graph, Mock())
+    
+    module.run(start_node=0)
+    buf = module._visited_buf
+    result = module.run(start_node=5)
+    
+    assert module._visited_buf is buf
+    assert "Sommets visités : 10 / 10" in result
+
+def test_get_description_without_instance():
+    """La description est lisible sans instancier le module."""
+    assert "DFS" in DFSModule.get_description()
@@ -0,0 +1,74 @@
+"""Tests pour l'algorithme de Dijkstra"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from graphlabs.core.graph import Graph
+from graphlabs.algorithms.kernels import dijkstra_csr
+from graphlabs.algorithms.shortest_path.dijkstra import DijkstraModule, _dijkstra_vectorized
+
+def test_dijkstra_simple():
+    """Test Dijkstra sur un graphe simple."""
+    graph = Graph()
+    n1 = graph.add_node(0, 0, "A")
+    n2 = graph.add_node(100, 0, "B")
+    n3 = graph.add_node(200, 0, "C")
+    
+    graph.add_edge(n1, n2, 5)
+    graph.add_edge(n2, n3, 3)
+    graph.add_edge(n1, n3, 10)
+    
+    module = DijkstraModule(graph, Mock())
+    result = module.run(start_node=n1, end_node=n3)
+    
+    assert "A → B → C" in result
+    assert "Distance totale : 8" in result
+
+def test_dijkstra_parallel_edges():
+    """Chaque arête parallèle garde son propre poids."""
+    graph = Graph()
+    n1 = graph.add_node(0, 0, "A")
+    n2 = graph.add_node(100, 0, "B")
+    
+    graph.add_edge(n1, n2, 7)
+    graph.add_edge(n2, n1, 2)
+    
+    module = DijkstraModule(graph, Mock())
+    result = module.run(start_node=n1, end_node=n2)
+    
+    assert "Distance totale : 2" in result
+
+def test_dijkstra_vectorized_parallel_edges():
+    """La relaxation vectorisée garde le meilleur poids entre arêtes parallèles."""
+    graph = Graph()
+    n1 = graph.add_node(0, 0, "A")
+    n2 = graph.add_node(100, 0, "B")
+    n3 = graph.add_node(200, 0, "C")
+    
+    graph.add_edge(n1, n2, 4)
+    graph.add_edge(n1, n2, 1)
+    graph.add_edge(n1, n2, 6)
+    graph.add_edge(n2, n3, 2)
+    
+    dist, prev = _dijkstra_vectorized(*graph.to_csr(), n1)
+    
+    assert dist.tolist() == [0, 1, 3]
+    assert prev.tolist() == [-1, n1, n2]
+
+def test_dijkstra_native_matches_kernel():
+    """L'extension C donne les mêmes distances et prédécesseurs que le noyau CSR."""
+    pytest.importorskip("graphlabs.algorithms._cdijkstra")
+    from graphlabs.algorithms.kernels import dijkstra_native
+    
+    rng = np.random.default_rng(0)
+    graph = Graph()
+    for _ in range(200):
+        graph.add_node(0, 0)
+    graph.add_edges_batch(rng.integers(0, 200, (800, 2)), rng.integers(1, 5, 800))
+    csr = graph.to_csr()
+    
+    dist, prev = dijkstra_native(*csr, 0)
+    expected_dist, expected_prev = dijkstra_csr(*csr, 0)
+    
+    assert dist.tolist() == expected_dist.tolist()
+    assert prev.tolist() == expected_prev.tolist()
@@ -0,0 +1,25 @@
+"""Tests pour les noyaux CSR (exécutés en Python pur sans Numba)"""
+
+from graphlabs.algorithms.kernels import bfs_csr, dfs_csr, dijkstra_csr, warmup
+from graphlabs.utils.graph_library import GraphLibrary
+
+def test_traversal_kernels_match_graph_order():
+    graph = GraphLibrary.create_binary_tree(3)
+    indptr, indices, _ = graph.to_csr()
+    
+    assert dfs_csr(indptr, indices, 0).tolist() == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
+    assert bfs_csr(indptr, indices, 0).tolist() == [0, 1, 8, 2, 5, 9, 12, 3, 4, 6, 7, 10, 11, 13, 14]
+
+def test_dijkstra_kernel():
+    graph = GraphLibrary.create_dijkstra_example()
+    indptr, indices, weights = graph.to_csr()
+    
+    dist, prev = dijkstra_csr(indptr, indices, weights, 0)
+    
+    assert dist[6] == 6
+    assert prev[6] == 4 and prev[4] == 2 and prev[2] == 0
+    assert prev[0] == -1
+
+def test_warmup():
+    """Le préchauffage s'exécute avec ou sans Numba"""
+    warmup()
@@ -1,8 +1,20 @@
 """Tests pour la classe Graph"""
 
+import numpy as np
 import pytest
 from graphlabs.core.graph import Graph, Node, Edge
 
+@pytest.fixture
+def star_graph():
+    """Trois sommets, le premier relié aux deux autres (poids 4 et 2)"""
+    g = Graph()
+    n1 = g.add_node(0, 0)
+    n2 = g.add_node(100, 100)
+    n3 = g.add_node(200, 200)
+    g.add_edge(n1, n2, 4)
+    g.add_edge(n1, n3, 2)
+    return g, n1, n2, n3
+
 def test_add_node():
     g = Graph()
     node_id = g.add_node(100, 200, "A")
@@ -18,14 +30,205 @@ def test_add_edge():
     assert len(g.edges) == 1
     assert g.edges[0].weight == 5.0
 
-def test_get_neighbors():
-    g = Graph()
-    n1 = g.add_node(0, 0)
-    n2 = g.add_node(100, 100)
-    n3 = g.add_node(200, 200)
-    g.add_edge(n1, n2)
-    g.add_edge(n1, n3)
+def test_get_neighbors(star_graph):
+    g, n1, n2, n3 = star_graph
     neighbors = g.get_neighbors(n1)
     assert len(neighbors) == 2
     assert n2 in neighbors
     assert n3 in neighbors
+    assert g.get_neighbors(n1) is neighbors
+    
+    g.remove_edge(n1, n2)
+    assert g.get_neighbors(n1) == (n3,)
+
+def test_add_edges_batch():
+    g = Graph()
+    n1 = g.add_node(0, 0)
+    n2 = g.add_node(100, 100)
+    n3 = g.add_node(200, 200)
+    g.add_edges_batch([(n1, n2, 3), (n2, n3, 1), (n1, 42, 1)])
+    assert len(g.edges) == 2
+    assert (g.edges[0].source, g.edges[0].target, g.edges[0].weight) == (n1, n2, 3)
+    assert list(g.get_neighbors(n2)) == [n1, n3]
+    
+    g.edge_endpoints()
+    g.add_edges_batch(np.array([[n3, n1], [n2, -1]]), weights=np.array([5, 1]))
+    assert g.get_neighbors_with_weight(n3) == [(n2, 1), (n1, 5)]
+    assert g.edge_endpoints().tolist() == [[n1, n2], [n2, n3], [n3, n1]]
+
+def test_edge_endpoints_grow_with_add_edge():
+    """Les ajouts prolongent le cache des extrémités sans toucher aux vues déjà rendues"""
+    g = Graph()
+    for i in range(40):
+        g.add_node(i, 0)
+    g.add_edge(0, 1)
+    first = g.edge_endpoints()
+    for i in range(1, 39):
+        g.add_edge(i, i + 1)
+    
+    assert first.tolist() == [[0, 1]]
+    assert g.edge_endpoints().tolist() == [[i, i + 1] for i in range(39)]
+    g.remove_edge(0, 1)
+    assert g.edge_endpoints()[0].tolist() == [1, 2]
+
+def test_degrees(star_graph):
+    g = star_graph[0]
+    assert g.degrees().tolist() == [2, 1, 1]
+
+def test_get_neighbors_with_weight():
+    g = Graph()
+    n1 = g.add_node(0, 0)
+    n2 = g.add_node(100, 100)
+    n3 = g.add_node(200, 200)
+    g.add_edge(n1, n2, 4)
+    g.add_edge(n3, n1, 2)
+    assert g.get_neighbors_with_weight(n1) == [(n2, 4), (n3, 2)]
+    g.remove_edge(n1, n2)
+    assert g.get_neighbors_with_weight(n1) == [(n3, 2)]
+
+def test_to_csr(star_graph):
+    g, n1, n2, n3 = star_graph
+    indptr, indices, weights = g.to_csr()
+    assert indptr.tolist() == [0, 2, 3, 4]
+    assert indices.tolist() == [n2, n3, n1, n1]
+    assert weights.tolist() == [4.0, 2.0, 4.0, 2.0]
+    assert g.to_csr()[0] is indptr
+
+def test_to_csr_weight_dtype():
+    """Poids CSR en float32 par défaut, float64 sur demande"""
+    g = Graph()
+    g64 = Graph(weight_dtype=np.float64)
+    for graph in (g, g64):
+        n1 = graph.add_node(0, 0)
+        n2 = graph.add_node(100, 100)
+        graph.add_edge(n1, n2, 0.1)
+    
+    assert g.to_csr()[2].dtype == np.float32
+    assert g64.to_csr()[2].tolist() == [0.1, 0.1]
+    assert g.edges[0].weight == 0.1
+
+def test_get_adjacency_matrix_after_removal():
+    g = Graph()
+    n1 = g.add_node(0, 0)
+    n2 = g.add_node(100, 100)
+    n3 = g.add_node(200, 200)
+    g.add_edge(n1, n3, 7)
+    g.remove_node(n2)
+    matrix = g.get_adjacency_matrix()
+    assert matrix.tolist() == [[0, 7], [7, 0]]
+
+def test_node_positions():
+    g = Graph()
+    n1 = g.add_node(0, 0)
+    n2 = g.add_node(100, 100)
+    n3 = g.add_node(200, 50)
+    g.move_node(n3, 250, 75)
+    g.remove_node(n2)
+    ids, xs, ys = g.node_positions()
+    assert ids.tolist() == [n1, n3]
+    assert xs.tolist() == [0, 250]
+    assert ys.tolist() == [0, 75]
+    assert (g.nodes[n3].x, g.nodes[n3].y) == (250, 75)
+    
+    copy = Graph()
+    copy.nodes = g.nodes
+    assert copy.node_positions()[0].tolist() == [n1, n3]
+
+def test_remove_node_updates_neighbors():
+    g = Graph()
+    ids = [g.add_node(i * 10, 0) for i in range(4)]
+    g.add_edge(ids[0], ids[1])
+    g.add_edge(ids[2], ids[0])
+    g.add_edge(ids[0], ids[3])
+    g.add_edge(ids[1], ids[3])
+    g.remove_node(ids[1])
+    assert list(g.get_neighbors(ids[0])) == [ids[2], ids[3]]
+    assert list(g.get_neighbors(ids[3])) == [ids[0]]
+    assert len(g.edges) == 2
+
+def test_to_csr_scipy():
+    pytest.importorskip("scipy")
+    g = Graph(directed=True)
+    n1 = g.add_node(0, 0)
+    n2 = g.add_node(100, 100)
+    g.add_edge(n1, n2, 3)
+    matrix = g.to_csr_scipy()
+    assert matrix.shape == (2, 2)
+    assert matrix[n1, n2] == 3
+    assert g.to_csr_scipy() is matrix
+
+def test_to_csr_scipy_keeps_neighbor_order():
+    """csgraph parcourt les voisins dans l'ordre de get_neighbors (colonnes non triées)"""
+    pytest.importorskip("scipy")
+    from scipy.sparse.csgraph import breadth_first_order, depth_first_order
+    
+    g = Graph()
+    a, b, c, d = (g.add_node(i * 100, 0) for i in range(4))
+    g.add_edge(a, c)
+    g.add_edge(a, b)
+    g.add_edge(b, d)
+    matrix = g.to_csr_scipy()
+    assert matrix.dtype == np.float64
+    assert matrix.indices.tolist() == g.to_csr()[1].tolist()
+    
+    dfs = depth_first_order(matrix, a, directed=True, return_predecessors=False)
+    bfs = breadth_first_order(matrix, a, directed=True, return_predecessors=False)
+    assert dfs.tolist() == [a, c, b, d]
+    assert bfs.tolist() == [a, c, b, d]
+
+def test_iter_neighbors():
+    g = Graph()
+    n1 = g.add_node(0, 0)
+    n2 = g.add_node(100, 100)
+    n3 = g.add_node(200, 200)
+    g.add_edge(n1, n2, 4)
+    g.add_edge(n3, n1, 2)
+    assert tuple(g.iter_neighbors(n1)) == g.get_neighbors(n1)
+    assert list(g.iter_neighbors_with_weight(n1)) == [(n2, 4), (n3, 2)]
+
+def test_compact():
+    g = Graph()
+    ids = [g.add_node(i * 10, 0, chr(65 + i)) for i in range(5)]
+    g.remove_node(ids[1])
+    g.add_edge(ids[0], ids[4], 3)
+    g.add_edge(ids[4], ids[2], 1)
+    mapping = g.compact()
+    assert sorted(g.nodes) == [0, 1, 2, 3]
+    assert g.next_id == 4
+    assert sorted(mapping) == [ids[0], ids[2], ids[3], ids[4]]
+    a, e = mapping[ids[0]], mapping[ids[4]]
+    assert g.nodes[a].label == "A" and g.nodes[a].x == 0
+    assert g.get_neighbors_with_weight(a) == [(e, 3)]
+    assert g.node_positions()[0].tolist() == [0, 1, 2, 3]
+    
+    with pytest.raises(ValueError):
+        g.compact(permutation=[0, 1, 2])
+
+def test_nodes_and_edges_in_rect():
+    """Sélection vectorisée des sommets et arêtes d'une zone"""
+    g = Graph()
+    a = g.add_node(0, 0)
+    b = g.add_node(100, 0)
+    c = g.add_node(300, 300)
+    g.add_edge(a, b)
+    g.add_edge(b, c)
+    g.add_edge(a, c)
+    
+    assert g.nodes_in_rect(-10, -10, 150, 50).tolist() == [a, b]
+    assert g.edges_in_rect(150, -50, 250, -20).tolist() == []
+    assert g.edges_in_rect(50, 100, 150, 150).tolist() == [1, 2]
+    
+    g.remove_node(c)
+    assert g.nodes_in_rect(-10, -10, 400, 400).tolist() == [a, b]
+    assert g.edges_in_rect(-10, -10, 400, 400).tolist() == [0]
+
+def test_node_edge_slots(star_graph):
+    """Sommets et arêtes sans __dict__, modifiés en place par le graphe"""
+    g, n1, n2, n3 = star_graph
+    node, edge = g.nodes[n1], g.edges[0]
+    assert not hasattr(node, "__dict__") and not hasattr(edge, "__dict__")
+    
+    g.move_node(n1, 10, 20)
+    g.update_edge_weight(n1, n2, 7)
+    assert g.nodes[n1] is node and (node.x, node.y) == (10, 20)
+    assert g.edges[0] is edge and edge.weight == 7
@@ -0,0 +1,21 @@
+"""Tests pour la bibliothèque de graphes"""
+
+from graphlabs.utils.graph_library import GraphLibrary
+
+def test_eulerian_circuit_degrees():
+    degrees = GraphLibrary.create_eulerian_circuit().degrees()
+    assert (degrees % 2 == 0).all()
+
+def test_eulerian_path_only_degrees():
+    degrees = GraphLibrary.create_eulerian_path_only().degrees()
+    assert (degrees % 2 == 1).sum() == 2
+
+def test_tree_no_cycle():
+    g = GraphLibrary.create_tree_no_cycle()
+    assert len(g.edges) == len(g.nodes) - 1
+    assert all(isinstance(node.label, str) for node in g.nodes.values())
+
+def test_utilities_is_complete_bipartite():
+    g = GraphLibrary.create_utilities()
+    assert len(g.edges) == 9
+    assert (g.degrees() == 3).all()